@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import json
+import mimetypes
 import sys
 from pathlib import Path
 from typing import Optional
 import pandas as pd
 
 from unifile import version, SUPPORTED_EXTENSIONS
-from unifile.pipeline import extract_to_table
+from unifile.pipeline import extract_to_table, detect_extractor
 # from unifile.utils.utils import norm_ext
 
 try:
@@ -17,13 +20,73 @@ try:
 except Exception:  # pragma: no cover
     requests = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAVE_PYARROW = True
+except Exception:  # pragma: no cover
+    pa = pq = None
+    HAVE_PYARROW = False
+
+
+# Shared HTTP session so repeated downloads reuse pooled keep-alive connections
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        atexit.register(_SESSION.close)
+    return _SESSION
+
+
+def _download(url: str, out: Path, max_bytes: Optional[int] = None) -> Path:
+    """
+    Stream ``url`` to ``out`` and return the path actually written.
 
-def _download(url: str, out: Path) -> Path:
+    When ``out`` has no supported extension, the response Content-Type is used
+    to pick one (appended to the filename). If neither identifies a supported
+    type, a ValueError is raised as soon as the headers arrive, before any of
+    the body is downloaded.
+
+    If ``max_bytes`` is given, a response whose Content-Length exceeds it is
+    rejected up front, and the transfer is aborted (and the partial file
+    removed) as soon as more than ``max_bytes`` have been received.
+    """
     if requests is None:
         raise RuntimeError("requests is required to download URLs. Please install 'requests'.")
-    resp = requests.get(url, timeout=60)
-    resp.raise_for_status()
-    out.write_bytes(resp.content)
+    # Stream the body straight to disk instead of buffering it in memory
+    with _get_session().get(url, timeout=60, stream=True) as resp:
+        resp.raise_for_status()
+        if not detect_extractor(out):
+            ctype = (resp.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+            guessed = mimetypes.guess_extension(ctype) if ctype else None
+            if not guessed or not detect_extractor(f"download{guessed}"):
+                raise ValueError(
+                    f"Unsupported download: '{out.name}' (Content-Type: {ctype or 'unknown'}). "
+                    f"Supported: {', '.join(SUPPORTED_EXTENSIONS)}"
+                )
+            out = out.with_name(out.name + guessed)
+        too_large = f"Download exceeds {max_bytes} bytes: {url}"
+        if max_bytes is not None:
+            try:
+                declared = int(resp.headers.get("Content-Length") or 0)
+            except ValueError:
+                declared = 0
+            if declared > max_bytes:
+                raise ValueError(too_large)
+        total = 0
+        try:
+            with open(out, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=64 * 1024):
+                    total += len(chunk)
+                    if max_bytes is not None and total > max_bytes:
+                        raise ValueError(too_large)
+                    f.write(chunk)
+        except BaseException:
+            out.unlink(missing_ok=True)
+            raise
     return out
 
 
@@ -46,6 +109,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     ep.add_argument("--ocr-lang", default="eng", help="OCR language for images and OCR fallback (default: eng).")
     ep.add_argument("--no-ocr", action="store_true", help="Disable OCR fallback for PDFs (vector text only).")
+    ep.add_argument(
+        "--max-download-mb",
+        type=float,
+        default=None,
+        help="Abort URL downloads larger than this many MiB (default: no limit).",
+    )
     ep.add_argument("--max-rows", type=int, default=None, help="Limit number of rows printed to stdout.")
     ep.add_argument("--max-colwidth", type=int, default=120, help="Max col width when printing to stdout.")
 
@@ -56,12 +125,39 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+def _json_encode_nested(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return ``df`` with dict/list cells (e.g. ``metadata``) encoded as JSON text.
+
+    Rows from different extractors carry different metadata keys and value
+    types, which Parquet struct inference cannot reconcile; a plain string
+    column is also far cheaper to write than an inferred nested schema.
+    """
+    nested = [
+        c for c in df.columns
+        if df[c].dtype == object and df[c].map(lambda v: isinstance(v, (dict, list))).any()
+    ]
+    if not nested:
+        return df
+    df = df.copy()
+    for c in nested:
+        df[c] = df[c].map(
+            lambda v: json.dumps(v, ensure_ascii=False, default=str) if isinstance(v, (dict, list)) else v
+        )
+    return df
+
+
 def _save_df(df: pd.DataFrame, out: Path) -> None:
     sfx = out.suffix.lower()
     if sfx == ".csv":
         df.to_csv(out, index=False)
     elif sfx == ".parquet":
-        df.to_parquet(out, index=False)
+        df = _json_encode_nested(df)
+        if HAVE_PYARROW:
+            tbl = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(tbl, out, compression="zstd", row_group_size=64_000, use_dictionary=True)
+        else:
+            df.to_parquet(out, index=False)
     elif sfx == ".jsonl":
         df.to_json(out, orient="records", lines=True, force_ascii=False)
     else:
@@ -94,8 +190,8 @@ def main(argv: Optional[list[str]] = None) -> int:
             # derive filename from URL or fallback
             from urllib.parse import urlparse
             name = Path(urlparse(src).path).name or "downloaded.bin"
-            tmp_download = Path.cwd() / f"unifile_download_{name}"
-            _download(src, tmp_download)
+            max_bytes = int(args.max_download_mb * (1 << 20)) if args.max_download_mb else None
+            tmp_download = _download(src, Path.cwd() / f"unifile_download_{name}", max_bytes=max_bytes)
             path = tmp_download
         else:
             path = Path(src)
@@ -16,17 +16,36 @@ Binary:
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Dict, Any
 import tempfile
 import subprocess
-import json
 
 from unifile.extractors.base import (
     BaseExtractor,
     make_row,
     Row,
 )
+from unifile.utils.utils import json_loads_safe
+
+
+@lru_cache(maxsize=256)
+def _ffprobe_json(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Run ffprobe once per file version; ``mtime_ns``/``size`` only key the cache.
+
+    Failures raise, so lru_cache does not remember them and the next call
+    probes again. The returned dict is the cached object itself; callers go
+    through :func:`_probe_media`, which hands out copies.
+    """
+    # Minimal, fast probe
+    out = subprocess.check_output(
+        ["ffprobe", "-v", "error", "-print_format", "json",
+         "-show_format", "-show_streams", path_str],
+        stderr=subprocess.STDOUT,
+    )
+    return json_loads_safe(out)
 
 
 def _probe_media(path: Path) -> Dict[str, Any]:
@@ -34,7 +53,10 @@ def _probe_media(path: Path) -> Dict[str, Any]:
 
     Executes a lightweight `ffprobe` call to gather format and stream
     information about the audio file. If ffprobe is not installed or
-    fails, an empty dictionary is returned.
+    fails, an empty dictionary is returned. Successful results are cached
+    per (path, mtime, size), so re-extracting an unchanged file does not
+    spawn ffprobe again; each call returns its own deep copy, so rows built
+    from it can be mutated freely.
 
     Args:
         path (Path): Path to the media file.
@@ -43,15 +65,11 @@ def _probe_media(path: Path) -> Dict[str, Any]:
         Dict[str, Any]: Parsed JSON output from ffprobe, or an empty dict.
     """
     try:
-        # Minimal, fast probe
-        out = subprocess.check_output(
-            ["ffprobe", "-v", "error", "-print_format", "json",
-             "-show_format", "-show_streams", str(path)],
-            stderr=subprocess.STDOUT,
-        )
-        return json.loads(out.decode("utf-8", errors="replace"))
+        st = path.stat()
+        probe = _ffprobe_json(str(path), st.st_mtime_ns, st.st_size)
     except Exception:
         return {}
+    return copy.deepcopy(probe)
 
 
 def _ensure_wav(input_path: Path) -> Path:
@@ -126,11 +144,13 @@ class _ASR:
         cls._initialized = True
 
     @classmethod
-    def transcribe(cls, audio_path: Path) -> Tuple[str, Dict[str, Any]]:
+    def transcribe(cls, audio_path: Any) -> Tuple[str, Dict[str, Any]]:
         """Transcribe an audio file to text.
 
         Args:
-            audio_path (Path): Path to the WAV (or other supported) audio file.
+            audio_path (Path | numpy.ndarray): Path to the WAV (or other
+                supported) audio file, or mono 16 kHz float32 samples, which
+                both backends accept directly.
 
         Returns:
             Tuple[str, Dict[str, Any]]:
@@ -138,14 +158,16 @@ class _ASR:
                 - Metadata dictionary with segments (start, end, text) when available
         """
         cls._init()
+        # Paths go to the backends as str; in-memory samples are passed through
+        audio = str(audio_path) if isinstance(audio_path, (str, Path)) else audio_path
         segments_meta = []
         if cls._use_fw:
             # faster-whisper stream of segments
             try:
-                segments, info = cls._model.transcribe(str(audio_path))
+                segments, info = cls._model.transcribe(audio)
             except TypeError:
                 # older API returns generator + info
-                segments_iter, info = cls._model.transcribe(str(audio_path), vad_filter=False)
+                segments_iter, info = cls._model.transcribe(audio, vad_filter=False)
                 segments = list(segments_iter)
             text_parts = []
             for s in segments:
@@ -155,7 +177,7 @@ class _ASR:
         else:
             # openai-whisper returns dict with segments
             import whisper
-            result = cls._model.transcribe(str(audio_path))
+            result = cls._model.transcribe(audio)
             text = (result.get("text") or "").strip()
             for s in result.get("segments", []) or []:
                 segments_meta.append({"start": float(s.get("start", 0)), "end": float(s.get("end", 0)), "text": s.get("text", "")})
@@ -4,15 +4,15 @@ Base extractor definitions.
 
 This module defines the common `Row` dataclass used to represent extracted
 units of text, the `Extractor` protocol that extractor implementations must
-conform to, and a `make_row` convenience function.
+conform to, and the `make_row` / `row_factory` convenience functions.
 """
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import (
+    Callable,
     List, 
     Optional, 
     Protocol, 
@@ -22,6 +22,38 @@ from typing import (
 )
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_jsonable(obj) -> bool:
+    """
+    Return True when ``json.dumps(obj)`` would succeed, without encoding it.
+
+    Walks dicts/lists/tuples with isinstance checks, which is far cheaper than
+    running the full encoder over every row's metadata just to discard the
+    result. Circular or too-deep structures raise RecursionError, which the
+    caller treats the same as a failed ``json.dumps``.
+    """
+    if isinstance(obj, _JSON_SCALARS):
+        return True
+    if isinstance(obj, dict):
+        return all(
+            isinstance(k, _JSON_SCALARS) and _is_jsonable(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return all(_is_jsonable(v) for v in obj)
+    return False
+
+
+def _safe_metadata(metadata):
+    """Return ``metadata`` if JSON-serializable, else ``{"_repr": str(metadata)}``."""
+    try:
+        ok = _is_jsonable(metadata)
+    except RecursionError:
+        ok = False
+    return metadata if ok else {"_repr": str(metadata)}
+
+
 @dataclass
 class Row:
     """
@@ -69,13 +101,25 @@ class Row:
         -----
         - If `metadata` contains non-serializable objects, it is replaced
           with a fallback dict: `{"_repr": str(metadata)}`.
+        - The dict is built field by field rather than with
+          :func:`dataclasses.asdict`, which would deep-copy `metadata` (e.g.
+          PDF document info, ASR segment lists) for every row. `metadata` is
+          therefore shared with the Row, not copied.
         """
-        d = asdict(self)
+        d = {
+            "source_path": self.source_path,
+            "source_name": self.source_name,
+            "file_type": self.file_type,
+            "unit_type": self.unit_type,
+            "unit_id": self.unit_id,
+            "content": self.content,
+            "char_count": self.char_count,
+            "metadata": self.metadata,
+            "status": self.status,
+            "error": self.error,
+        }
         # ensure metadata is JSON-serializable (best-effort)
-        try:
-            json.dumps(d["metadata"])
-        except Exception:
-            d["metadata"] = {"_repr": str(d["metadata"])}
+        d["metadata"] = _safe_metadata(d["metadata"])
         return d
 
 def make_row(path: Path, file_type: str, unit_type: str, unit_id: str, content: str, metadata: dict, status: str = "ok", error: Optional[str] = None) -> Row:
@@ -121,6 +165,40 @@ def make_row(path: Path, file_type: str, unit_type: str, unit_id: str, content:
     )
 
 
+def row_factory(path: Path, file_type: str) -> Callable[..., Row]:
+    """
+    Return a :func:`make_row` equivalent bound to a single source file.
+
+    Extractors that emit many rows per file (pages, slides, chunks) would
+    otherwise recompute ``str(path)`` and ``path.name`` for every row; the
+    returned callable computes them once.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the source file.
+    file_type : str
+        Normalized extension (e.g., "pdf").
+
+    Returns
+    -------
+    Callable[..., Row]
+        ``make(unit_type, unit_id, content, metadata, status="ok", error=None)``
+        producing the same :class:`Row` as :func:`make_row` would.
+    """
+    source_path = str(path)
+    source_name = path.name
+
+    def make(unit_type: str, unit_id: str, content: str, metadata: dict, status: str = "ok", error: Optional[str] = None) -> Row:
+        txt = content or ""
+        return Row(
+            source_path, source_name, file_type, unit_type, str(unit_id),
+            txt, len(txt), metadata or {}, status, error,
+        )
+
+    return make
+
+
 class Extractor(Protocol):
     """
     Protocol (interface) that all extractors must implement.
@@ -74,10 +74,9 @@ class DocxExtractor(BaseExtractor):
         # Collect tables (serialize cells as tab-delimited)
         table_blobs: list[tuple[int, str]] = []
         for ti, t in enumerate(doc.tables):
-            lines: list[str] = []
-            for row in t.rows:
-                lines.append("\t".join((cell.text or "") for cell in row.cells))
-            table_text = "\n".join(lines).strip()
+            table_text = "\n".join(
+                "\t".join([cell.text or "" for cell in row.cells]) for row in t.rows
+            ).strip()
             if table_text:
                 table_blobs.append((ti, table_text))
 
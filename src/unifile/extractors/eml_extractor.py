@@ -50,8 +50,10 @@ class EmlExtractor(BaseExtractor):
                     - ``"attachments"``: List of attachment filenames
                 - status: ``"ok"``
         """
-        data = path.read_bytes()
-        msg = BytesParser(policy=policy.default).parsebytes(data)
+        # Feed the parser from the file handle so the raw message bytes are not
+        # held in memory alongside the parsed tree (large attachments)
+        with path.open("rb") as f:
+            msg = BytesParser(policy=policy.default).parse(f)
 
         subject = msg.get("Subject", "")
         sender = msg.get("From", "")
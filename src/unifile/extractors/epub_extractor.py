@@ -9,7 +9,7 @@ from ebooklib import epub
 
 from unifile.extractors.base import (
     BaseExtractor,
-    make_row,
+    row_factory,
     Row,
 )
 
@@ -44,12 +44,13 @@ class EpubExtractor(BaseExtractor):
                     - ``"warning"``: Present if no chapters were found
         """
         book = epub.read_epub(str(path))
+        make = row_factory(path, "epub")
         rows: List[Row] = []
         for i, item in enumerate(book.get_items_of_type(9)):  # 9: DOCUMENT
             html = item.get_content().decode("utf-8", errors="replace")
             soup = BeautifulSoup(html, "lxml")
             text = soup.get_text("\n")
-            rows.append(make_row(path, "epub", "chapter", str(i), text, {"id": item.get_id()}))
+            rows.append(make("chapter", str(i), text, {"id": item.get_id()}))
         if not rows:
-            rows.append(make_row(path, "epub", "file", "body", "", {"warning": "no chapters found"}))
+            rows.append(make("file", "body", "", {"warning": "no chapters found"}))
         return rows
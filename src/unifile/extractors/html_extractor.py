@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from unifile.extractors.base import (
     BaseExtractor,
@@ -13,6 +16,96 @@ from unifile.extractors.base import (
 )
 
 
+# Elements whose text is not visible (BeautifulSoup's get_text skips them too)
+_HIDDEN_TAGS = frozenset({"script", "style", "template"})
+# Elements whose whitespace-only strings are kept verbatim
+_PRESERVE_WS_TAGS = frozenset({"pre", "textarea"})
+_ASCII_WS = " \t\n\r\f"
+# libxml2's tree ends at the first </html>; BeautifulSoup keeps what follows
+_RE_HTML_END = re.compile(r"</html\s*>", re.IGNORECASE)
+
+
+def _visible_strings(root) -> Iterator[str]:
+    """
+    Yield the visible text nodes under ``root`` in document order.
+
+    Mirrors BeautifulSoup's ``get_text`` on an lxml-built soup: ``<br>`` becomes
+    a newline, hidden elements and comments are skipped, and whitespace-only
+    strings collapse to a single newline (or space) outside ``<pre>`` and
+    ``<textarea>``.
+    """
+    hidden = keep_ws = 0
+
+    def norm(s: str) -> str:
+        # Same test as BeautifulSoup: only ASCII whitespace counts as blank
+        if keep_ws or s.strip(_ASCII_WS):
+            return s
+        return "\n" if "\n" in s else " "
+
+    for event, el in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            tag = el.tag
+            if tag in _HIDDEN_TAGS:
+                hidden += 1
+            if tag in _PRESERVE_WS_TAGS:
+                keep_ws += 1
+            if hidden:
+                continue
+            if tag == "br":
+                yield "\n"
+            elif el.text:
+                yield norm(el.text)
+            continue
+        if event == "end":
+            tag = el.tag
+            if tag in _HIDDEN_TAGS:
+                hidden -= 1
+            if tag in _PRESERVE_WS_TAGS:
+                keep_ws -= 1
+        # Comments/PIs contribute only the text that follows them
+        if el.tail and not hidden:
+            yield norm(el.tail)
+
+
+def _html_text_lxml(html: str) -> Tuple[str, Optional[str]]:
+    """Visible text and ``<title>`` of ``html`` using lxml's C tree directly."""
+    root = lxml.html.document_fromstring(html)
+    title_el = root.find(".//title")
+    title = title_el.text if title_el is not None else None
+    return "\n".join(_visible_strings(root)), title
+
+
+def _html_text_bs4(html: str) -> Tuple[str, Optional[str]]:
+    """Visible text and ``<title>`` of ``html`` via BeautifulSoup (fallback)."""
+    soup = BeautifulSoup(html, "lxml")
+
+    # Convert <br> tags into newlines to preserve intended line breaks
+    for br in soup.find_all("br"):
+        br.replace_with("\n")
+
+    # Extract visible text; BeautifulSoup collapses whitespace appropriately
+    text = soup.get_text("\n")
+    title = soup.title.string if soup.title else None
+    return text, title
+
+
+def _html_text(html: str) -> Tuple[str, Optional[str]]:
+    """
+    Visible text and ``<title>`` of ``html``, preferring the lxml tree walk.
+
+    BeautifulSoup handles documents the lxml tree cannot represent faithfully:
+    anything but whitespace after the first ``</html>`` (dropped from lxml's
+    tree), and markup ``lxml.html`` rejects outright (e.g. empty documents).
+    """
+    end = _RE_HTML_END.search(html)
+    if end is None or not html[end.end():].strip(_ASCII_WS):
+        try:
+            return _html_text_lxml(html)
+        except Exception:
+            pass
+    return _html_text_bs4(html)
+
+
 class HtmlExtractor(BaseExtractor):
     """
     HTML --> plain-text extractor.
@@ -21,6 +114,12 @@ class HtmlExtractor(BaseExtractor):
     row containing the document's visible text. `<br>` elements are converted
     to newlines prior to text extraction.
 
+    Text is collected by walking lxml's parse tree directly, producing the
+    same strings as BeautifulSoup's ``get_text("\\n")`` without building a
+    soup. Whitespace after the closing ``</html>`` is not reproduced. Documents
+    with other content after ``</html>`` (which lxml's tree drops), or that
+    lxml rejects, are parsed with BeautifulSoup instead.
+
     It inherits :meth:`BaseExtractor.extract` for path validation and
     exception-to-error-row wrapping. The parsing logic is implemented in
     :meth:`_extract`.
@@ -52,17 +151,10 @@ class HtmlExtractor(BaseExtractor):
             A single row with visible text content and optional page title.
         """
         html = path.read_text(errors="replace")
-        soup = BeautifulSoup(html, "lxml")
-
-        # Convert <br> tags into newlines to preserve intended line breaks
-        for br in soup.find_all("br"):
-            br.replace_with("\n")
-
-        # Extract visible text; BeautifulSoup collapses whitespace appropriately
-        text = soup.get_text("\n")
+        # Walking lxml's tree avoids building BeautifulSoup's Python-level copy
+        text, title = _html_text(html)
 
         file_type = path.suffix.lstrip(".").lower() or "html"
-        title = soup.title.string if soup.title else None
 
         return [
             make_row(
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Sequence, Union
 from PIL import Image
 import pytesseract
 
@@ -12,6 +14,40 @@ from unifile.extractors.base import (
     make_row,
     Row,
 )
+# Optional resident Tesseract API (tesserocr), shared with the PDF OCR path
+from unifile.utils.ocr import HAVE_TESSEROCR, tess_api
+
+
+# Formats Tesseract (via Leptonica) can read directly from disk
+_TESSERACT_NATIVE = frozenset({"png", "jpg", "jpeg", "tif", "tiff", "bmp"})
+
+# Grayscale (max - min) contrast below which an image is treated as blank
+_BLANK_CONTRAST = 8
+
+
+def _is_blank(img: Image.Image) -> bool:
+    """
+    Cheap pre-OCR check: True when the image has (almost) no ink at all.
+
+    Uses the grayscale extrema, a single C-level pass over the pixels, rather
+    than a downscaled variance: a lone line of small text still shows up as a
+    dark extreme, so real content is never skipped.
+    """
+    lo, hi = img.convert("L").getextrema()
+    return hi - lo < _BLANK_CONTRAST
+
+
+def _init_ocr_worker() -> None:
+    """
+    Keep Tesseract single-threaded inside each worker to avoid oversubscription.
+
+    Like the PDF page pool, this leaves an ``OMP_THREAD_LIMIT`` the user already
+    set alone, and does nothing when ``UNIFILE_TESSERACT_OMP`` is non-empty.
+    """
+    if os.getenv("UNIFILE_TESSERACT_OMP", "").strip():
+        return
+    if "OMP_THREAD_LIMIT" not in os.environ:
+        os.environ["OMP_THREAD_LIMIT"] = "1"
 
 
 class ImageExtractor(BaseExtractor):
@@ -19,8 +55,9 @@ class ImageExtractor(BaseExtractor):
     Image --> text (OCR) extractor.
 
     This extractor opens an image, normalizes its mode for OCR, and uses
-    Tesseract (via `pytesseract`) to extract text. It emits a single row with
-    basic image metadata.
+    Tesseract (via `pytesseract`, or a resident `tesserocr` API when that is
+    installed) to extract text. It emits a single row with basic image
+    metadata.
 
     Inherits :meth:`BaseExtractor.extract` for path validation and
     exception-to-error-row wrapping. The core logic lives in :meth:`_extract`.
@@ -36,6 +73,9 @@ class ImageExtractor(BaseExtractor):
     - unit_id:   "0"
     - content:   OCR text (empty string if none)
     - metadata:  {"width": int, "height": int, "mode": str}
+      (plus ``"ocr_skipped": "blank"`` when a near-uniform image bypasses OCR;
+      checked only for images OCR'd from decoded pixels, not for files
+      Tesseract reads by path)
     """
 
     supported_extensions = ["png", "jpg", "jpeg", "tif", "tiff", "bmp", "webp", "gif"]
@@ -65,16 +105,41 @@ class ImageExtractor(BaseExtractor):
         list[Row]
             A single row with OCR text and basic image metadata.
         """
-        # Open via context manager to ensure resources are freed.
+        file_type = path.suffix.lstrip(".").lower() or "png"
+
+        # Open via context manager to ensure resources are freed. Image.open is
+        # lazy, so size/mode come from the header without decoding pixels.
         with Image.open(str(path)) as img:
-            # Normalize palette/alpha images to RGB for better OCR behavior.
             if img.mode in ("P", "RGBA"):
+                # Normalize palette/alpha images to RGB for better OCR behavior.
                 img = img.convert("RGB")
+                ocr_input = img
+            elif file_type in _TESSERACT_NATIVE and getattr(img, "n_frames", 1) == 1:
+                # Tesseract reads these formats itself; handing it the path
+                # skips pytesseract's decode + temp-file re-encode round-trip.
+                ocr_input = str(path)
+            else:
+                ocr_input = img
 
-            text = pytesseract.image_to_string(img, lang=self.ocr_lang) or ""
             meta = {"width": img.width, "height": img.height, "mode": img.mode}
+            # The blank check needs decoded pixels, so it only runs when the
+            # image is handed over as a PIL image (decoded once, then reused);
+            # path inputs are decoded by Tesseract alone
+            if not isinstance(ocr_input, str) and _is_blank(img):
+                # Nothing to read; skip launching Tesseract entirely
+                text = ""
+                meta["ocr_skipped"] = "blank"
+            elif HAVE_TESSEROCR:
+                # Model stays loaded across images (per thread / worker process)
+                api = tess_api(self.ocr_lang)
+                if isinstance(ocr_input, str):
+                    api.SetImageFile(ocr_input)
+                else:
+                    api.SetImage(ocr_input)
+                text = api.GetUTF8Text() or ""
+            else:
+                text = pytesseract.image_to_string(ocr_input, lang=self.ocr_lang) or ""
 
-        file_type = path.suffix.lstrip(".").lower() or "png"
         return [
             make_row(
                 path=path,
@@ -86,3 +151,35 @@ class ImageExtractor(BaseExtractor):
                 status="ok",
             )
         ]
+
+    def extract_batch(
+        self,
+        paths: Sequence[Union[str, Path]],
+        max_workers: Optional[int] = None,
+    ) -> List[List[Row]]:
+        """
+        OCR many images in parallel, one worker process per CPU by default.
+
+        Each Tesseract call is CPU-bound and independent, so spreading files
+        across processes scales close to linearly with cores.
+
+        Parameters
+        ----------
+        paths
+            Image files to process.
+        max_workers
+            Upper bound on worker processes (defaults to ``os.cpu_count()``).
+            With a single worker (or a single path) files are processed
+            in-process.
+
+        Returns
+        -------
+        list[list[Row]]
+            The result of :meth:`extract` for each path, in input order.
+        """
+        paths = [Path(p) for p in paths]
+        workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            return [self.extract(p) for p in paths]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker) as pool:
+            return list(pool.map(self.extract, paths))
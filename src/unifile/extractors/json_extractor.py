@@ -3,52 +3,104 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
-import json
+from typing import BinaryIO, List, Optional, Tuple
+import io
 
 from unifile.extractors.base import (
     BaseExtractor,
     make_row,
     Row,
 )
+from unifile.utils.utils import json_loads_safe
 
 
-def _flatten(obj, prefix=""):
-    """Recursively flatten a nested JSON object.
+def _flatten(obj, parts=()):
+    """Flatten a nested JSON object.
 
-    Converts nested dictionaries and lists into dot/bracket-delimited
-    key paths with corresponding values, suitable for text extraction.
+    Converts nested dictionaries and lists into dot-delimited key paths with
+    corresponding values, suitable for text extraction. Walks an explicit
+    stack of ``(value, key_parts)`` pairs and joins each key path at the leaf.
 
     Args:
         obj: A JSON object (dict, list, or scalar).
-        prefix (str, optional): String prefix used for recursive key building.
-            Defaults to an empty string.
+        parts (tuple, optional): Key parts to prefix every emitted path with.
+            Defaults to an empty tuple.
 
     Yields:
-        Tuple[str, Any]: A tuple containing the flattened key path and its value.
+        Tuple[str, Any]: A tuple containing the flattened key path and its value,
+        in document order.
     """
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            yield from _flatten(v, f"{prefix}{k}.")
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            yield from _flatten(v, f"{prefix}{i}.")
-    else:
-        yield prefix[:-1], obj
+    stack = [(obj, tuple(parts))]
+    pop, push = stack.pop, stack.extend
+    while stack:
+        cur, parts = pop()
+        if isinstance(cur, dict):
+            # Push in reverse so children pop off in their original order
+            push([(v, parts + (str(k),)) for k, v in reversed(cur.items())])
+        elif isinstance(cur, list):
+            push([(cur[i], parts + (str(i),)) for i in range(len(cur) - 1, -1, -1)])
+        else:
+            yield ".".join(parts), cur
+
+
+def _first_line(f: BinaryIO) -> Tuple[bytes, bool]:
+    """Read the first non-blank line of a binary stream, stripped.
+
+    Only the first two non-blank lines are read. A file with a single
+    non-blank line (typically minified JSON) is thus read exactly once, and
+    that line is the whole document.
+
+    Args:
+        f (BinaryIO): Stream positioned at the start of the file.
+
+    Returns:
+        Tuple[bytes, bool]: The stripped first non-blank line (``b""`` if
+        none) and whether another non-blank line follows it.
+    """
+    first = b""
+    for line in f:
+        first = line.strip()
+        if first:
+            break
+    return first, any(not line.isspace() for line in f)
+
+
+def _is_ndjson_record(line: bytes) -> bool:
+    """Whether ``line`` is a complete JSON object on its own.
+
+    A pretty-printed document whose first line is just ``{`` is therefore not
+    mistaken for NDJSON.
+    """
+    if not line.startswith(b"{"):
+        return False
+    try:
+        json_loads_safe(line)
+    except Exception:
+        return False
+    return True
 
 
 class JsonExtractor(BaseExtractor):
     """Extractor for JSON and NDJSON files.
 
     This extractor supports:
-      - **NDJSON (newline-delimited JSON)**: treated as raw text.
+      - **NDJSON (newline-delimited JSON)**: streamed line by line; each record
+        is flattened with its record index as the leading key part.
       - **JSON objects/arrays**: flattened into key-value pairs for easier search.
 
     The extracted output is returned as a single row per file with a
     ``format`` metadata field indicating the detected type.
+
+    Args:
+        max_ndjson_records (int, optional): Stop after this many NDJSON
+            records (``metadata["truncated"]`` is then set). Defaults to no
+            limit.
     """
     supported_extensions = ["json"]
 
+    def __init__(self, max_ndjson_records: Optional[int] = None):
+        self.max_ndjson_records = max_ndjson_records
+
     def _extract(self, path: Path) -> List[Row]:
         """Extract text content from a JSON or NDJSON file.
 
@@ -67,18 +119,71 @@ class JsonExtractor(BaseExtractor):
                 - section: ``body``
                 - text: Extracted lines or raw text
                 - metadata: Dictionary with a ``"format"`` key indicating
-                  one of ``"ndjson"``, ``"json"``, or ``"text"``
+                  one of ``"ndjson"``, ``"json"``, or ``"text"``. NDJSON rows
+                  also carry ``"records"`` and, when applicable,
+                  ``"invalid_lines"`` and ``"truncated"``.
         """
-        txt = path.read_text(errors="replace").strip()
-        # NDJSON quickly?
-        if "\n" in txt and txt.lstrip().startswith("{"):
-            return [make_row(path, "json", "file", "body", txt, {"format": "ndjson"})]
+        with path.open("rb") as f:
+            first, more = _first_line(f)
+            if more and _is_ndjson_record(first):
+                f.seek(0)
+                return [self._extract_ndjson(path, f)]
+            # A single non-blank line is the whole document; only multi-line
+            # documents need reading in full
+            if more:
+                f.seek(0)
+                data = f.read().strip()
+            else:
+                data = first
+
+        # Decode straight from bytes; text is only materialized for fallbacks
         try:
-            obj = json.loads(txt)
+            obj = json_loads_safe(data)
         except Exception:
+            txt = data.decode("utf-8", errors="replace")
             return [make_row(path, "json", "file", "body", txt, {"format": "text"})]
 
-        lines = []
-        for k, v in _flatten(obj):
-            lines.append(f"{k}={v}")
-        return [make_row(path, "json", "file", "body", "\n".join(lines), {"format": "json"})]
+        content = "\n".join(f"{k}={v}" for k, v in _flatten(obj))
+        return [make_row(path, "json", "file", "body", content, {"format": "json"})]
+
+    def _extract_ndjson(self, path: Path, f: BinaryIO) -> Row:
+        """Stream NDJSON records from ``f`` into flattened ``key=value`` lines.
+
+        Only one input line is held in memory at a time. Lines that fail to
+        parse are counted and skipped rather than aborting the file.
+
+        Args:
+            path (Path): Source path, used for the row's provenance fields.
+            f (BinaryIO): Binary stream positioned at the start of the file.
+
+        Returns:
+            Row: A single ``ndjson`` row.
+        """
+        buf = io.StringIO()
+        write = buf.write
+        cap = self.max_ndjson_records
+        records = invalid = 0
+        truncated = False
+        for line in f:
+            # Parsers accept surrounding whitespace, so blank lines are the
+            # only ones that need a look before parsing
+            if line.isspace():
+                continue
+            if cap is not None and records >= cap:
+                truncated = True
+                break
+            try:
+                rec = json_loads_safe(line)
+            except Exception:
+                invalid += 1
+                continue
+            for k, v in _flatten(rec, (str(records),)):
+                write(f"{k}={v}\n")
+            records += 1
+
+        meta = {"format": "ndjson", "records": records}
+        if invalid:
+            meta["invalid_lines"] = invalid
+        if truncated:
+            meta["truncated"] = True
+        return make_row(path, "json", "file", "body", buf.getvalue().rstrip("\n"), meta)
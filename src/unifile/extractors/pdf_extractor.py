@@ -2,20 +2,173 @@
 
 from __future__ import annotations
 
+import math
 import os
-import io
-from typing import List
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import List, Optional, Sequence, Union
 from pathlib import Path
 
 import fitz  # PyMuPDF
 import pytesseract
-from PIL import Image
 
 from unifile.extractors.base import (
     BaseExtractor,
-    make_row,
+    row_factory,
     Row,
 )
+# Optional in-process Tesseract (tesserocr), shared with the image extractor
+from unifile.utils.ocr import HAVE_TESSEROCR, tess_api
+
+# OMP_THREAD_LIMIT=1 is exported only while a document is OCR'd by more than
+# one worker (see _tesseract_omp_limit); several extractions may overlap, so
+# the variable is reference-counted and removed when the last one finishes
+_OMP_LOCK = threading.Lock()
+_OMP_USERS = 0
+_OMP_SET = False
+
+
+@contextmanager
+def _tesseract_omp_limit(workers: int):
+    """
+    Limit Tesseract's OpenMP threads to one while ``workers`` pages run at once.
+
+    Tesseract uses OpenMP across all cores by default; with several pages
+    OCR'd concurrently that oversubscribes the CPU badly, so parallelism comes
+    from the page pool instead. ``tesseract`` processes inherit the variable
+    when spawned. Nothing is changed when ``workers`` is 1, when the user
+    already set ``OMP_THREAD_LIMIT``, or when ``UNIFILE_TESSERACT_OMP`` is
+    non-empty.
+    """
+    global _OMP_USERS, _OMP_SET
+    if workers <= 1 or os.getenv("UNIFILE_TESSERACT_OMP", "").strip():
+        yield
+        return
+    with _OMP_LOCK:
+        if _OMP_USERS == 0 and "OMP_THREAD_LIMIT" not in os.environ:
+            os.environ["OMP_THREAD_LIMIT"] = "1"
+            _OMP_SET = True
+        _OMP_USERS += 1
+    try:
+        yield
+    finally:
+        with _OMP_LOCK:
+            _OMP_USERS -= 1
+            if _OMP_USERS == 0 and _OMP_SET:
+                os.environ.pop("OMP_THREAD_LIMIT", None)
+                _OMP_SET = False
+
+
+def _is_blank_page(page) -> bool:
+    """True if nothing at all is painted on the page (no text, paths or images)."""
+    try:
+        return not page.get_bboxlog()
+    except Exception:
+        # Unknown content: let the OCR path decide
+        return False
+
+
+# Pixel budget per rasterized page (~2000x2000); 2x zoom is the cap
+_OCR_TARGET_PIXELS = 4_000_000
+_OCR_MAX_ZOOM = 2.0
+
+
+def _ocr_zoom(rect) -> float:
+    """
+    Render zoom for OCR of a page with the given rect (in points).
+
+    ``UNIFILE_OCR_ZOOM`` forces a fixed zoom. Otherwise the zoom is 2x (about
+    144 DPI) for ordinary page sizes and shrinks for large formats so the
+    pixmap stays within :data:`_OCR_TARGET_PIXELS`.
+    """
+    try:
+        forced = float(os.getenv("UNIFILE_OCR_ZOOM") or 0)
+    except ValueError:
+        forced = 0
+    if forced > 0:
+        return forced
+    area = rect.width * rect.height
+    if area <= 0:
+        return _OCR_MAX_ZOOM
+    return min(_OCR_MAX_ZOOM, math.sqrt(_OCR_TARGET_PIXELS / area))
+
+
+def _ocr_concurrency() -> int:
+    """Number of concurrent OCR workers (``UNIFILE_OCR_CONCURRENCY``, default: CPU count)."""
+    try:
+        n = int(os.getenv("UNIFILE_OCR_CONCURRENCY") or 0)
+    except ValueError:
+        n = 0
+    return max(1, n or os.cpu_count() or 1)
+
+
+def _ocr_batch_size() -> int:
+    """Pages per Tesseract invocation (``UNIFILE_OCR_BATCH_SIZE``, default: 4)."""
+    try:
+        n = int(os.getenv("UNIFILE_OCR_BATCH_SIZE") or 0)
+    except ValueError:
+        n = 0
+    return max(1, n or 4)
+
+
+def _ocr_page(image_path: Path, lang: str) -> str:
+    """OCR a single rasterized page image (without Tesseract's trailing form feed)."""
+    if HAVE_TESSEROCR:
+        api = tess_api(lang)
+        api.SetImageFile(str(image_path))
+        return api.GetUTF8Text() or ""
+    return (pytesseract.image_to_string(str(image_path), lang=lang) or "").removesuffix("\f")
+
+
+def _ocr_batch(image_paths: Sequence[Path], lang: str) -> List[str]:
+    """
+    OCR several page images with one Tesseract run.
+
+    Tesseract accepts a text file listing image paths as its input and emits a
+    form feed after each page, so the model is loaded once per batch instead
+    of once per page. With tesserocr the pages are simply OCR'd in turn.
+    """
+    if HAVE_TESSEROCR or len(image_paths) == 1:
+        # The resident API has no per-run startup to amortize
+        return [_ocr_page(p, lang) for p in image_paths]
+    listing = image_paths[0].with_suffix(".list.txt")
+    listing.write_text("\n".join(str(p) for p in image_paths) + "\n")
+    try:
+        out = pytesseract.image_to_string(str(listing), lang=lang) or ""
+    finally:
+        listing.unlink(missing_ok=True)
+    # Every page ends with a form feed, so N pages split into N + 1 parts
+    texts = out.split("\f")
+    if len(texts) != len(image_paths) + 1 or texts[-1].strip():
+        raise RuntimeError(f"Tesseract returned {len(texts) - 1} pages for {len(image_paths)} images")
+    return texts[:-1]
+
+
+def _ocr_pages(image_paths: Sequence[Path], lang: str) -> List[Union[str, Exception]]:
+    """
+    Worker task: OCR a batch, retrying page by page if the batch run fails.
+
+    Returns one entry per image, either the text or the exception raised for
+    that page. Page images are deleted once read.
+    """
+    try:
+        try:
+            return list(_ocr_batch(image_paths, lang))
+        except Exception:
+            results: List[Union[str, Exception]] = []
+            for p in image_paths:
+                try:
+                    results.append(_ocr_page(p, lang))
+                except Exception as e:
+                    results.append(e)
+            return results
+    finally:
+        for p in image_paths:
+            p.unlink(missing_ok=True)
 
 
 class PdfExtractor(BaseExtractor):
@@ -34,6 +187,13 @@ class PdfExtractor(BaseExtractor):
     ---------------------
     - `UNIFILE_DISABLE_PDF_OCR` (truthy -> disables OCR fallback)
     - `UNIFILE_OCR_LANG` (e.g., "eng", "deu", "spa")
+    - `UNIFILE_OCR_CONCURRENCY` (max concurrent Tesseract runs; default: CPU count)
+    - `UNIFILE_OCR_BATCH_SIZE` (pages per Tesseract run; default: 4)
+    - `UNIFILE_OCR_ZOOM` (fixed render zoom for OCR; default: 2x, reduced
+      for large page formats to cap pixmap size)
+    - `UNIFILE_TESSERACT_OMP` (truthy -> leave Tesseract's OpenMP threading
+      alone; by default `OMP_THREAD_LIMIT=1` is exported, unless already
+      defined, only while a document's pages are OCR'd by several workers)
 
     Output Rows
     -----------
@@ -51,6 +211,19 @@ class PdfExtractor(BaseExtractor):
 
     Notes
     -----
+    - Pages with no painted content at all (per MuPDF's bbox log) are emitted
+      as empty page rows without being rasterized.
+    - Pages needing OCR are rasterized in grayscale on the calling thread and
+      written as uncompressed PGM files to a per-document temp directory. Batches of
+      pages are OCR'd by a single Tesseract run each (amortizing model load);
+      batches run on a small thread pool while the next pages render. If a
+      batch run fails, its pages are retried one at a time so failures stay
+      isolated per page. At most two batches per worker are pending, which
+      bounds temp disk usage on long scans. If `tesserocr` is installed, each
+      worker thread keeps its own resident Tesseract API instead of starting a
+      `tesseract` process per batch. Each pixmap is released right
+      after it is written, and MuPDF's resource store is emptied once a
+      document that needed rasterizing is done.
     - On OCR errors for a specific page, an **error row** is emitted for that
       page with `status="error"` and a `"warning": "OCR failed"` metadata tag;
       processing continues for subsequent pages.
@@ -96,66 +269,108 @@ class PdfExtractor(BaseExtractor):
         if env_lang:
             self.ocr_lang = env_lang
 
-        rows: List[Row] = []
-
-        # Use context manager to ensure the document is closed
-        with fitz.open(str(path)) as doc:
-            for i, page in enumerate(doc):
-                text = page.get_text("text") or ""
-                meta = {"page": i, "rect": list(page.rect), "ocr": False}
-
-                if (not text.strip()) and self.ocr_if_empty:
-                    try:
-                        # High-res rasterization for better OCR quality
-                        mat = fitz.Matrix(2.0, 2.0)
-                        pix = page.get_pixmap(matrix=mat)
-                        img = Image.open(io.BytesIO(pix.tobytes("png")))
-                        text = pytesseract.image_to_string(img, lang=self.ocr_lang) or ""
-                        meta["ocr"] = True
-                    except Exception as e:
-                        # Emit an error row for this page but continue with others
-                        rows.append(
-                            make_row(
-                                path,
-                                "pdf",
-                                "page",
-                                str(i),
-                                text,
-                                {**meta, "warning": "OCR failed"},
-                                status="error",
-                                error=str(e),
-                            )
-                        )
-                        continue
+        # Path-derived row fields are computed once for every page row
+        make = row_factory(path, "pdf")
+        # Page rows by index (sized once the document is open); OCR'd pages are
+        # filled in as their results land
+        rows: List[Optional[Row]] = []
+        workers = _ocr_concurrency()
+        batch_size = _ocr_batch_size()
+        batch: list = []  # [(i, meta, native_text, image_path)]
+        in_flight: deque = deque()
+        work: Optional[Path] = None
+        omp_limited = False  # set once the first OCR batch enters the OMP limit
+
+        def _ocr_error_row(i: int, meta: dict, native: str, e: Exception) -> Row:
+            return make(
+                "page",
+                str(i),
+                native,
+                {**meta, "warning": "OCR failed"},
+                status="error",
+                error=str(e),
+            )
 
-                rows.append(
-                    make_row(
-                        path,
-                        "pdf",
-                        "page",
-                        str(i),
-                        text,
-                        meta,
-                        status="ok",
-                    )
-                )
-
-            # Append document-level metadata if available
+        def _submit_batch() -> None:
+            nonlocal omp_limited
+            if not omp_limited:
+                omp.enter_context(_tesseract_omp_limit(workers))
+                omp_limited = True
+            in_flight.append((batch[:], pool.submit(_ocr_pages, [b[3] for b in batch], self.ocr_lang)))
+            batch.clear()
+
+        def _finish_oldest() -> None:
+            entries, fut = in_flight.popleft()
             try:
-                meta = doc.metadata or {}
-                rows.append(
-                    make_row(
-                        path,
-                        "pdf",
-                        "file",
-                        "meta",
-                        "",
-                        {"metadata": meta},
-                        status="ok",
-                    )
-                )
-            except Exception:
-                # Metadata can occasionally fail to read; ignore silently
-                pass
+                results = fut.result()
+            except Exception as e:
+                results = [e] * len(entries)
+            for (i, meta, native, _), res in zip(entries, results):
+                if isinstance(res, Exception):
+                    # Emit an error row for this page but continue with others
+                    rows[i] = _ocr_error_row(i, meta, native, res)
+                else:
+                    meta["ocr"] = True
+                    rows[i] = make("page", str(i), res, meta, status="ok")
+
+        try:
+            # Use context manager to ensure the document is closed
+            # The OMP limit (entered with the first OCR batch) is released only
+            # after the pool has drained
+            with ExitStack() as omp, fitz.open(str(path)) as doc, \
+                    ThreadPoolExecutor(max_workers=workers) as pool:
+                rows = [None] * doc.page_count
+                for i, page in enumerate(doc):
+                    text = page.get_text("text") or ""
+                    meta = {"page": i, "rect": list(page.rect), "ocr": False}
+
+                    # isspace() stops at the first visible character (strip() would
+                    # copy the page); blank pages skip the 2x rasterization entirely
+                    if (not text or text.isspace()) and self.ocr_if_empty and not _is_blank_page(page):
+                        try:
+                            if work is None:
+                                work = Path(tempfile.mkdtemp(prefix="unifile_pdfocr_"))
+                            # Grayscale render (Tesseract binarizes anyway, and it is a
+                            # third of the RGB bytes); MuPDF writes the raw samples as
+                            # PGM (no compression pass)
+                            zoom = _ocr_zoom(page.rect)
+                            img_path = work / f"{i}.pgm"
+                            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY)
+                            try:
+                                pix.save(str(img_path))
+                            finally:
+                                # Drop the multi-MB sample buffer before the next page
+                                pix = None
+                        except Exception as e:
+                            rows[i] = _ocr_error_row(i, meta, text, e)
+                            continue
+                        batch.append((i, meta, text, img_path))
+                        if len(batch) >= batch_size:
+                            _submit_batch()
+                            # Bound pending work: at most two batches per worker queued
+                            while len(in_flight) >= 2 * workers:
+                                _finish_oldest()
+                        continue
+
+                    rows[i] = make("page", str(i), text, meta, status="ok")
+
+                if batch:
+                    _submit_batch()
+                while in_flight:
+                    _finish_oldest()
+
+                # Append document-level metadata if available
+                try:
+                    meta = doc.metadata or {}
+                    rows.append(make("file", "meta", "", {"metadata": meta}, status="ok"))
+                except Exception:
+                    # Metadata can occasionally fail to read; ignore silently
+                    pass
+        finally:
+            if work is not None:
+                shutil.rmtree(work, ignore_errors=True)
+                # Rendering fills MuPDF's global resource store (decoded images,
+                # fonts); empty it so long scans don't hold that memory afterwards
+                fitz.TOOLS.store_shrink(100)
 
         return rows
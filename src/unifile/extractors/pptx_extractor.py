@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 from pptx import Presentation
 
 from unifile.extractors.base import (
     BaseExtractor,
-    make_row,
+    row_factory,
     Row,
 )
 
 
+def _shape_text(shape) -> str:
+    """Text of one shape; tables are serialized as tab-delimited rows."""
+    if shape.has_table:
+        return "\n".join("\t".join(cell.text or "" for cell in row.cells) for row in shape.table.rows)
+    return getattr(shape, "text", "")
+
+
 class PptxExtractor(BaseExtractor):
     """
     PPTX --> plain-text extractor.
 
     For each slide, this extractor gathers text from shapes that expose a
-    `.text` attribute and emits one standardized row per slide.
+    `.text` attribute, plus table cells, and emits one standardized row per
+    slide.
 
     Inherits :meth:`BaseExtractor.extract` for path validation and
     exception-to-error-row wrapping. The slide parsing logic is implemented
@@ -30,14 +38,16 @@ class PptxExtractor(BaseExtractor):
         - file_type: "pptx"
         - unit_type: "slide"
         - unit_id:   str(i)
-        - content:   Combined newline-joined text from slide shapes
+        - content:   Combined newline-joined text from slide shapes (tables
+                     as tab-delimited lines)
         - metadata:  {"slide_index": i}
 
     Notes
     -----
     - Shapes without textual content are skipped.
     - Errors on individual shapes are ignored, so one bad shape does not
-      prevent the rest of the slide from being processed.
+      prevent the rest of the slide from being processed. Slides are read in
+      one pass; only a slide that raises is re-read shape by shape.
     """
 
     supported_extensions = ["pptx"]
@@ -58,31 +68,26 @@ class PptxExtractor(BaseExtractor):
             One row per slide with collected text content.
         """
         prs = Presentation(str(path))
-        rows: List[Row] = []
-
-        for i, slide in enumerate(prs.slides):
-            texts: list[str] = []
-            for shape in slide.shapes:
-                # Some shapes (e.g., pictures, charts, tables) may not have .text;
-                # guard with hasattr and swallow unexpected shape-level errors.
-                try:
-                    if hasattr(shape, "text") and shape.text:
-                        texts.append(shape.text)
-                except Exception:
-                    # Ignore problematic shapes; proceed with the rest
-                    continue
+        make = row_factory(path, "pptx")
+        slides = prs.slides
+        rows: List[Optional[Row]] = [None] * len(slides)
+
+        for i, slide in enumerate(slides):
+            # Pictures, charts, etc. have no .text; getattr's default covers them
+            try:
+                texts = [t for t in map(_shape_text, slide.shapes) if t]
+            except Exception:
+                # Some shape failed: redo the slide, skipping problematic shapes
+                texts = []
+                for shape in slide.shapes:
+                    try:
+                        t = _shape_text(shape)
+                    except Exception:
+                        continue
+                    if t:
+                        texts.append(t)
 
             content = "\n".join(texts).strip()
-            rows.append(
-                make_row(
-                    path=path,
-                    file_type="pptx",
-                    unit_type="slide",
-                    unit_id=str(i),
-                    content=content,
-                    metadata={"slide_index": i},
-                    status="ok",
-                )
-            )
+            rows[i] = make("slide", str(i), content, {"slide_index": i}, status="ok")
 
         return rows
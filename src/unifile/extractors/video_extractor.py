@@ -3,31 +3,58 @@
 Video --> transcript extractor (optional).
 
 Strategy:
-  - Extract/convert audio track to mono 16k WAV via ffmpeg
-  - Feed WAV to the same ASR backend selection used by AudioExtractor
+  - Decode the audio track to mono 16k samples in-process with PyAV when it
+    is installed; otherwise extract a mono 16k WAV via the ffmpeg binary
+  - Feed the samples/WAV to the same ASR backend selection used by AudioExtractor
 
 Requirements (install optional extra):
     pip install ".[media]"
 
 Binary:
-    FFmpeg must be available on PATH.
+    FFmpeg must be available on PATH unless PyAV (`av`) is installed.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 import tempfile
 import subprocess
-import json
 
-from unifile.extractors.audio_extractor import _ASR  # reuse the same backend selection
+from unifile.extractors.audio_extractor import _ASR, _probe_media  # reuse the same backend selection
 from unifile.extractors.base import (
     BaseExtractor,
     make_row,
     Row,
 )
 
+# Optional in-process decoding (pip install av): no ffmpeg process, no temp WAV
+try:
+    import av
+    import numpy as np
+    HAVE_AV = True
+except Exception:
+    av = None
+    HAVE_AV = False
+
+
+def _pyav_audio(path: Path):
+    """Decode the first audio track to mono 16 kHz float32 samples in [-1, 1]."""
+    with av.open(str(path)) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=16000)
+        chunks = []
+        for frame in container.decode(stream):
+            chunks.extend(f.to_ndarray() for f in resampler.resample(frame))
+        # Flush samples buffered in the resampler
+        chunks.extend(f.to_ndarray() for f in resampler.resample(None))
+    if not chunks:
+        raise ValueError(f"No audio decoded from {path.name}")
+    audio = np.concatenate(chunks, axis=1).ravel().astype(np.float32)
+    audio /= 32768.0
+    return audio
+
 
 def _ffmpeg_audio(path: Path) -> Path:
     """Extract audio track to mono 16k WAV with ffmpeg."""
@@ -41,15 +68,8 @@ def _ffmpeg_audio(path: Path) -> Path:
 
 
 def _probe_video(path: Path) -> Dict[str, Any]:
-    try:
-        out = subprocess.check_output(
-            ["ffprobe", "-v", "error", "-print_format", "json",
-             "-show_format", "-show_streams", str(path)],
-            stderr=subprocess.STDOUT,
-        )
-        return json.loads(out.decode("utf-8", errors="replace"))
-    except Exception:
-        return {}
+    # Same cached ffprobe run as AudioExtractor (keyed on path, mtime and size)
+    return _probe_media(path)
 
 
 class VideoExtractor(BaseExtractor):
@@ -72,21 +92,41 @@ class VideoExtractor(BaseExtractor):
     supported_extensions = ["mp4", "mov", "mkv", "webm"]
 
     def _extract(self, path: Path) -> List[Row]:
-        wav = _ffmpeg_audio(path)
-        try:
-            text, meta = _ASR.transcribe(wav)
-        finally:
-            try:
-                wav.unlink(missing_ok=True)
-            except Exception:
-                pass
-
-        probe = _probe_video(path)
+        # ffprobe is an independent subprocess; run it while ffmpeg and ASR work
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            probe_future = pool.submit(_probe_video, path)
+            samples = None
+            if HAVE_AV:
+                try:
+                    samples = _pyav_audio(path)
+                except Exception:
+                    # Containers/codecs PyAV can't handle still go through ffmpeg
+                    samples = None
+            if samples is not None:
+                text, meta = _ASR.transcribe(samples)
+            else:
+                wav = _ffmpeg_audio(path)
+                try:
+                    text, meta = _ASR.transcribe(wav)
+                finally:
+                    try:
+                        wav.unlink(missing_ok=True)
+                    except Exception:
+                        pass
+            probe = probe_future.result()
+
+        # Split streams by type in one pass
+        streams: Dict[str, List[Dict[str, Any]]] = {"video": [], "audio": []}
+        for s in probe.get("streams", []):
+            bucket = streams.get(s.get("codec_type"))
+            if bucket is not None:
+                bucket.append(s)
+        fmt = probe.get("format") or {}
         meta["probe"] = {
-            "format": (probe.get("format") or {}).get("format_name"),
-            "duration": (probe.get("format") or {}).get("duration"),
-            "video_streams": [s for s in probe.get("streams", []) if s.get("codec_type") == "video"],
-            "audio_streams": [s for s in probe.get("streams", []) if s.get("codec_type") == "audio"],
+            "format": fmt.get("format_name"),
+            "duration": fmt.get("duration"),
+            "video_streams": streams["video"],
+            "audio_streams": streams["audio"],
         }
 
         return [
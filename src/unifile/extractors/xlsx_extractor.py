@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import csv
+import datetime as _dt
+import io
+import re
+import zipfile
 from pathlib import Path
-from typing import List
+from typing import Any, List, Tuple
 
 import openpyxl
 import pandas as pd
@@ -11,9 +16,63 @@ import pandas as pd
 from unifile.extractors.base import (
     BaseExtractor,
     make_row,
+    row_factory,
     Row,
 )
 
+# Optional Rust workbook reader (pip install python-calamine); also reads .xls
+try:
+    from python_calamine import CalamineWorkbook
+    HAVE_CALAMINE = True
+except Exception:
+    CalamineWorkbook = None
+    HAVE_CALAMINE = False
+
+# Error cells (#DIV/0!, #N/A, ...) in SpreadsheetML sheet parts
+_RE_ERROR_CELL = re.compile(rb"""<c\b[^>]*\bt=["']e["']""")
+
+
+def _has_error_cells(path: Path) -> bool:
+    """
+    Return True if an .xlsx/.xlsm workbook contains error-valued cells.
+
+    python-calamine hands error cells back as ``""``, indistinguishable from
+    empty ones, so workbooks holding any are left to openpyxl, which renders
+    the ``#...`` code. Non-zip files (legacy .xls) return False.
+    """
+    if not zipfile.is_zipfile(path):
+        return False
+    with zipfile.ZipFile(path) as zf:
+        for name in zf.namelist():
+            if not (name.startswith("xl/worksheets/") and name.endswith(".xml")):
+                continue
+            with zf.open(name) as f:
+                tail = b""
+                while True:
+                    chunk = f.read(1 << 20)
+                    if not chunk:
+                        break
+                    # keep the end of the previous chunk so a split <c ...> tag still matches
+                    buf = tail + chunk
+                    if _RE_ERROR_CELL.search(buf):
+                        return True
+                    tail = buf[buf.rfind(b"<"):] if b"<" in buf else b""
+    return False
+
+
+def _calamine_cell(v: Any) -> str:
+    """Render a calamine cell value the way the openpyxl path renders it."""
+    if v is None or v == "":
+        return ""
+    # calamine reports every number as float and date-only cells as date;
+    # openpyxl yields ints for whole numbers and datetimes for dates; above
+    # 2**53 the float is no longer an exact integer, so keep its float form
+    if type(v) is float and v.is_integer() and abs(v) < 2**53:
+        return str(int(v))
+    if type(v) is _dt.date:
+        return str(_dt.datetime(v.year, v.month, v.day))
+    return str(v)
+
 
 class ExcelExtractor(BaseExtractor):
     """
@@ -27,6 +86,12 @@ class ExcelExtractor(BaseExtractor):
     exception-to-error-row wrapping. The actual spreadsheet reading is
     implemented in :meth:`_extract`.
 
+    If ``python-calamine`` is installed, workbooks are read with it (Rust,
+    several times faster than openpyxl, and able to read legacy ``.xls``);
+    cell values are rendered to match the openpyxl path. openpyxl remains the
+    default and the fallback for files calamine cannot open, and it also reads
+    workbooks containing error cells, which calamine reports as empty.
+
     Supported extensions
     --------------------
     xlsx, xlsm, xltx, xltm, xls
@@ -57,38 +122,85 @@ class ExcelExtractor(BaseExtractor):
         list[Row]
             Standardized rows for each worksheet.
         """
+        if HAVE_CALAMINE:
+            try:
+                if not _has_error_cells(path):
+                    return self._extract_calamine(path)
+            except Exception:
+                # Fall back to openpyxl for anything calamine cannot read
+                pass
+
         rows: List[Row] = []
+        make = row_factory(path, path.suffix.lstrip(".").lower() or "xlsx")
         # openpyxl doesn't support a context manager on load_workbook; ensure close()
         wb = openpyxl.load_workbook(str(path), read_only=True, data_only=True)
         try:
             for ws in wb.worksheets:
-                lines: list[str] = []
-                for row in ws.iter_rows(values_only=True):
-                    vals = ["" if v is None else str(v) for v in row]
-                    lines.append("\t".join(vals))
-                text = "\n".join(lines)
-                rows.append(
-                    make_row(
-                        path=path,
-                        file_type=path.suffix.lstrip(".").lower() or "xlsx",
-                        unit_type="sheet",
-                        unit_id=ws.title,
-                        content=text,
-                        metadata={"nrows": ws.max_row, "ncols": ws.max_column},
-                        status="ok",
-                    )
-                )
+                # One comprehension per sheet: no per-row list appends or temporaries
+                text = "\n".join([
+                    "\t".join(["" if v is None else str(v) for v in row])
+                    for row in ws.iter_rows(values_only=True)
+                ])
+                meta = {"nrows": ws.max_row, "ncols": ws.max_column}
+                rows.append(make("sheet", ws.title, text, meta, status="ok"))
         finally:
             wb.close()
         return rows
 
+    def _extract_calamine(self, path: Path) -> List[Row]:
+        """Same output as :meth:`_extract`, reading the workbook with calamine."""
+        rows: List[Row] = []
+        make = row_factory(path, path.suffix.lstrip(".").lower() or "xlsx")
+        wb = CalamineWorkbook.from_path(str(path))
+        try:
+            for name in wb.sheet_names:
+                # skip_empty_area=False keeps the grid anchored at A1, like openpyxl
+                grid = wb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+                text = "\n".join([
+                    "\t".join([_calamine_cell(v) for v in row]) for row in grid
+                ])
+                # openpyxl reports an empty sheet as 1x1
+                meta = {"nrows": max(len(grid), 1), "ncols": max(len(grid[0]) if grid else 0, 1)}
+                rows.append(make("sheet", name, text, meta, status="ok"))
+        finally:
+            # close() only exists in newer python-calamine releases
+            close = getattr(wb, "close", None)
+            if close is not None:
+                close()
+        return rows
+
+
+def _read_csv_text(path: Path) -> Tuple[str, int, int]:
+    """
+    Read a CSV file verbatim and count its records in the same pass.
+
+    Returns ``(text, rows, cols)`` where ``rows`` excludes the header and blank
+    lines (as ``pandas.read_csv`` counts them) and ``cols`` is the header width.
+    Quoted fields spanning several lines count as one record.
+    """
+    lines: List[str] = []
+    keep = lines.append
+
+    with path.open("r", encoding="utf-8-sig", errors="replace") as f:
+        def _tee():
+            for line in f:
+                keep(line)
+                yield line
+
+        reader = csv.reader(_tee())
+        header = next(reader, [])
+        nrows = sum(1 for rec in reader if rec)
+    return "".join(lines), nrows, len(header)
+
 
 class CsvExtractor(BaseExtractor):
     """
     CSV/TSV --> plain-text (CSV serialization) extractor.
 
-    This extractor reads a **CSV** or **TSV** into a pandas DataFrame and emits
-    a single row whose `content` is the canonical CSV serialization
+    This extractor emits a single row whose `content` is CSV text. A **CSV**
+    file's text is used as-is (newlines normalized to ``\\n``; records are
+    counted with the C ``csv`` parser in the same pass). A **TSV** is read with
+    pandas in chunks and converted to its CSV serialization
     (`df.to_csv(index=False)`), preserving headers and row order.
 
     Inherits :meth:`BaseExtractor.extract` for path validation and
@@ -104,12 +216,23 @@ class CsvExtractor(BaseExtractor):
     - file_type: "csv" or "tsv"
     - unit_type: "table"
     - unit_id:   "0"
-    - content:   CSV text (comma-separated; TSV is first read with tab sep)
+    - content:   CSV text (the file's own text for CSV; TSV is first read
+                 with tab sep and re-serialized)
     - metadata:  {"rows": int, "cols": int}
     """
 
     supported_extensions = ["csv", "tsv"]
 
+    def __init__(self, chunksize: int = 200_000):
+        """
+        Parameters
+        ----------
+        chunksize
+            Rows parsed per pandas chunk when converting TSV, bounding the
+            DataFrame held in memory at once.
+        """
+        self.chunksize = chunksize
+
     def _extract(self, path: Path) -> List[Row]:
         """
         Parse a CSV/TSV file into a single standardized row.
@@ -125,19 +248,31 @@ class CsvExtractor(BaseExtractor):
         list[Row]
             A single row with CSV text content and basic table metadata.
         """
-        sep = "\t" if path.suffix.lower().lstrip(".") == "tsv" else ","
-        # dtype=str preserves textual fidelity and avoids dtype inference surprises
-        df = pd.read_csv(path, sep=sep, dtype=str)
-        text = df.to_csv(index=False)
+        file_type = path.suffix.lstrip(".").lower() or "csv"
+        if file_type == "tsv":
+            # dtype=str preserves textual fidelity and avoids dtype inference
+            # surprises; chunks are serialized as they are parsed so only one
+            # chunk's DataFrame is alive at a time
+            buf = io.StringIO()
+            nrows = ncols = 0
+            with pd.read_csv(path, sep="\t", dtype=str, chunksize=self.chunksize) as reader:
+                for i, chunk in enumerate(reader):
+                    chunk.to_csv(buf, index=False, header=(i == 0))
+                    nrows += len(chunk)
+                    ncols = len(chunk.columns)
+            text = buf.getvalue()
+        else:
+            # Already CSV: keep the text as-is rather than parse + re-serialize
+            text, nrows, ncols = _read_csv_text(path)
 
         return [
             make_row(
                 path=path,
-                file_type=path.suffix.lstrip(".").lower() or "csv",
+                file_type=file_type,
                 unit_type="table",
                 unit_id="0",
                 content=text,
-                metadata={"rows": len(df), "cols": len(df.columns)},
+                metadata={"rows": nrows, "cols": ncols},
                 status="ok",
             )
         ]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from bs4 import BeautifulSoup
 
 from unifile.extractors.base import (
@@ -12,22 +12,78 @@ from unifile.extractors.base import (
     Row,
 )
 
+try:
+    from lxml import etree
+    HAVE_LXML = True
+except Exception:
+    etree = None
+    HAVE_LXML = False
+
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+def _collapse(s: str) -> str:
+    # BeautifulSoup folds whitespace-only strings to a single newline/space.
+    if s.strip(_ASCII_SPACES):
+        return s
+    return "\n" if "\n" in s else " "
+
+
+def _xml_text_lxml(path: Path) -> tuple[str, Optional[str]]:
+    """Stream text and root name out of ``path`` with ``etree.iterparse``.
+
+    An element's ``text`` (or ``tail``) is only complete once the parser has
+    reached the next event, so each one is emitted lazily on the following
+    event; that keeps the strings in document order while finished elements
+    are cleared and detached as we go.
+    """
+    parts: List[str] = []
+    root_name: Optional[str] = None
+    pending = None  # (element, "text" | "tail")
+    events = ("start", "end", "comment", "pi")
+    for ev, el in etree.iterparse(str(path), events=events, recover=True):
+        if pending is not None:
+            node, attr = pending
+            s = getattr(node, attr)
+            if s and (attr == "text" or node.getparent() is not None):
+                parts.append(_collapse(s))
+            if attr == "tail":
+                parent = node.getparent()
+                node.clear()
+                if parent is not None:
+                    parent.remove(node)
+        if ev == "start":
+            if root_name is None:
+                root_name = etree.QName(el).localname
+            pending = (el, "text")
+        else:
+            pending = (el, "tail")
+    return "\n".join(parts), root_name
+
+
+def _xml_text_bs4(path: Path) -> tuple[str, Optional[str]]:
+    with path.open("rb") as f:
+        soup = BeautifulSoup(f, "lxml-xml")
+    root = soup.find()  # first tag
+    return soup.get_text("\n"), (root.name if root else None)
+
 
 class XmlExtractor(BaseExtractor):
-    """Extractor for XML files using BeautifulSoup with the lxml-xml parser.
+    """Extractor for XML files using lxml's streaming ``iterparse``.
 
-    This extractor reads XML files, parses them with BeautifulSoup,
+    This extractor streams XML files through ``lxml.etree.iterparse``
     and extracts the visible text content. The root tag name of the
-    document is also included in the extracted metadata.
+    document is also included in the extracted metadata. BeautifulSoup
+    with the lxml-xml parser is used as a fallback.
     """
     supported_extensions = ["xml"]
 
     def _extract(self, path: Path) -> List[Row]:
         """Extract text content from an XML file.
 
-        The method reads the XML file, parses it with the ``lxml-xml`` parser,
-        and returns a single row containing all visible text. The row metadata
-        includes the name of the root tag, if present.
+        The method streams the XML file through lxml in recover mode and
+        returns a single row containing all visible text. The row metadata
+        includes the local name of the root tag, if present.
 
         Args:
             path (Path): Path to the XML file.
@@ -40,9 +96,12 @@ class XmlExtractor(BaseExtractor):
                 - text: Extracted visible text content
                 - metadata: Dictionary with the root tag name under ``"root"``
         """
-        xml = path.read_text(errors="replace")
-        soup = BeautifulSoup(xml, "lxml-xml")
-        text = soup.get_text("\n")
-        root = soup.find()  # first tag
-        root_name = root.name if root else None
+        text = root_name = None
+        if HAVE_LXML:
+            try:
+                text, root_name = _xml_text_lxml(path)
+            except Exception:
+                text = None
+        if text is None:
+            text, root_name = _xml_text_bs4(path)
         return [make_row(path, "xml", "file", "body", text, {"root": root_name})]
@@ -17,8 +17,10 @@ Design notes
 -----------
 
 * The registry maps normalized lower-case extensions (without dots) to callables
-  that return **new extractor instances**. This ensures extractors are stateless
-  across calls.
+  that return extractor instances. The built-in factories hand back one shared
+  instance per extractor class **per thread** (extractors keep no per-file
+  state; runtime options are re-applied before every call). Pass
+  ``reuse_extractors=False`` to construct a fresh instance each time.
 * ``extract_to_table`` accepts either a filesystem path or raw bytes plus a
   filename hint; in the latter case data is persisted to a temporary file so we
   can reuse file-based extractors uniformly.
@@ -31,6 +33,10 @@ The pipeline can accept the same flags the CLI exposes:
   * ``ocr_lang`` (str): language code for OCR (images and PDF OCR fallback)
   * ``no_ocr`` (bool): disable OCR fallback for PDFs (vector text only)
 
+- Extractor reuse
+  * ``reuse_extractors`` (bool): reuse one instance per extractor class and
+    thread across calls (default True)
+
 - ASR / Media (optional, if media extractors installed)
   * ``asr_model`` (str): ASR model name (e.g., "small")
   * ``asr_device`` (str): "cpu" or "cuda"
@@ -50,12 +56,13 @@ them up consistently:
 from __future__ import annotations
 
 import os
+import threading
 from pathlib import Path
 from typing import List, Optional, Union
 import pandas as pd
 
 from unifile.utils.utils import write_temp_file, norm_ext
-from unifile.extractors.base import Row
+from unifile.extractors.base import Row, _safe_metadata
 from unifile.extractors.pdf_extractor import PdfExtractor
 from unifile.extractors.docx_extractor import DocxExtractor
 from unifile.extractors.pptx_extractor import PptxExtractor
@@ -95,6 +102,8 @@ _RUNTIME = {
     "asr_model": None,
     "asr_device": None,
     "asr_compute_type": None,
+    # Reuse extractor instances across extract_to_table calls
+    "reuse_extractors": True,
 }
 
 def _apply_runtime_env():
@@ -123,6 +132,7 @@ def set_runtime_options(
     asr_model: Optional[str] = None,
     asr_device: Optional[str] = None,
     asr_compute_type: Optional[str] = None,
+    reuse_extractors: Optional[bool] = None,
 ) -> None:
     """
     Update in-process runtime options (mirrors CLI flags) and export to env.
@@ -138,78 +148,101 @@ def set_runtime_options(
         _RUNTIME["asr_device"] = asr_device
     if asr_compute_type is not None:
         _RUNTIME["asr_compute_type"] = asr_compute_type
+    if reuse_extractors is not None:
+        _RUNTIME["reuse_extractors"] = bool(reuse_extractors)
 
     _apply_runtime_env()
 
 
 # ----------------------------- Registry & factories -----------------------------
 
-# Base registry (pure constructors)
+_INSTANCES = threading.local()
+
+
+def _shared(cls):
+    """
+    This thread's cached ``cls()`` instance, or a fresh one when reuse is off.
+
+    The class is passed in at call time (``lambda: _shared(PdfExtractor)``), so
+    monkeypatching e.g. ``pipeline.PdfExtractor`` yields a separate instance.
+    """
+    if not _RUNTIME["reuse_extractors"]:
+        return cls()
+    instances = getattr(_INSTANCES, "by_class", None)
+    if instances is None:
+        instances = _INSTANCES.by_class = {}
+    inst = instances.get(cls)
+    if inst is None:
+        inst = instances[cls] = cls()
+    return inst
+
+
+# Base registry (shared per-thread instances, see _shared)
 REGISTRY_BASE = {
-    "pdf": lambda: PdfExtractor(),
-    "docx": lambda: DocxExtractor(),
-    "pptx": lambda: PptxExtractor(),
+    "pdf": lambda: _shared(PdfExtractor),
+    "docx": lambda: _shared(DocxExtractor),
+    "pptx": lambda: _shared(PptxExtractor),
     # spreadsheets
-    "xlsx": lambda: ExcelExtractor(),
-    "xls": lambda: ExcelExtractor(),
-    "xlsm": lambda: ExcelExtractor(),
-    "xltx": lambda: ExcelExtractor(),
-    "xltm": lambda: ExcelExtractor(),
-    "csv": lambda: CsvExtractor(),
-    "tsv": lambda: CsvExtractor(),
+    "xlsx": lambda: _shared(ExcelExtractor),
+    "xls": lambda: _shared(ExcelExtractor),
+    "xlsm": lambda: _shared(ExcelExtractor),
+    "xltx": lambda: _shared(ExcelExtractor),
+    "xltm": lambda: _shared(ExcelExtractor),
+    "csv": lambda: _shared(CsvExtractor),
+    "tsv": lambda: _shared(CsvExtractor),
     # images (OCR)
-    "png": lambda: ImageExtractor(),
-    "jpg": lambda: ImageExtractor(),
-    "jpeg": lambda: ImageExtractor(),
-    "bmp": lambda: ImageExtractor(),
-    "tif": lambda: ImageExtractor(),
-    "tiff": lambda: ImageExtractor(),
-    "webp": lambda: ImageExtractor(),
-    "gif": lambda: ImageExtractor(),
+    "png": lambda: _shared(ImageExtractor),
+    "jpg": lambda: _shared(ImageExtractor),
+    "jpeg": lambda: _shared(ImageExtractor),
+    "bmp": lambda: _shared(ImageExtractor),
+    "tif": lambda: _shared(ImageExtractor),
+    "tiff": lambda: _shared(ImageExtractor),
+    "webp": lambda: _shared(ImageExtractor),
+    "gif": lambda: _shared(ImageExtractor),
     # plain text-ish
-    "txt": lambda: TextExtractor(),
-    "md": lambda: TextExtractor(),
-    "rtf": lambda: TextExtractor(),
-    "log": lambda: TextExtractor(),
+    "txt": lambda: _shared(TextExtractor),
+    "md": lambda: _shared(TextExtractor),
+    "rtf": lambda: _shared(TextExtractor),
+    "log": lambda: _shared(TextExtractor),
     # html
-    "html": lambda: HtmlExtractor(),
-    "htm": lambda: HtmlExtractor(),
+    "html": lambda: _shared(HtmlExtractor),
+    "htm": lambda: _shared(HtmlExtractor),
     # eml
-    "eml":  lambda: EmlExtractor(),
+    "eml":  lambda: _shared(EmlExtractor),
 }
 
 if INCLUDE_FILE_TYPES_COMPRESSED:
     REGISTRY_BASE.update({
         # compressed / containers
-        "zip":  lambda: ArchiveExtractor(),
-        "tar":  lambda: ArchiveExtractor(),
-        "gz":   lambda: ArchiveExtractor(),
-        "tgz":  lambda: ArchiveExtractor(),
-        "bz2":  lambda: ArchiveExtractor(),
-        "tbz":  lambda: ArchiveExtractor(),
-        "xz":   lambda: ArchiveExtractor(),
+        "zip":  lambda: _shared(ArchiveExtractor),
+        "tar":  lambda: _shared(ArchiveExtractor),
+        "gz":   lambda: _shared(ArchiveExtractor),
+        "tgz":  lambda: _shared(ArchiveExtractor),
+        "bz2":  lambda: _shared(ArchiveExtractor),
+        "tbz":  lambda: _shared(ArchiveExtractor),
+        "xz":   lambda: _shared(ArchiveExtractor),
         # epub
-        "epub": lambda: EpubExtractor(),
+        "epub": lambda: _shared(EpubExtractor),
         # json
-        "json": lambda: JsonExtractor(),
+        "json": lambda: _shared(JsonExtractor),
         # xml
-        "xml":  lambda: XmlExtractor(),
+        "xml":  lambda: _shared(XmlExtractor),
     })
 
 if INCLUDE_FILE_TYPES_MEDIA:
     REGISTRY_BASE.update({
         # audio
-        "wav":  lambda: AudioExtractor(),
-        "mp3":  lambda: AudioExtractor(),
-        "m4a":  lambda: AudioExtractor(),
-        "flac": lambda: AudioExtractor(),
-        "ogg":  lambda: AudioExtractor(),
-        "webm": lambda: AudioExtractor(),  # audio-only webm treated as audio here
-        "aac":  lambda: AudioExtractor(),
+        "wav":  lambda: _shared(AudioExtractor),
+        "mp3":  lambda: _shared(AudioExtractor),
+        "m4a":  lambda: _shared(AudioExtractor),
+        "flac": lambda: _shared(AudioExtractor),
+        "ogg":  lambda: _shared(AudioExtractor),
+        "webm": lambda: _shared(AudioExtractor),  # audio-only webm treated as audio here
+        "aac":  lambda: _shared(AudioExtractor),
         # video
-        "mp4":  lambda: VideoExtractor(),
-        "mov":  lambda: VideoExtractor(),
-        "mkv":  lambda: VideoExtractor(),
+        "mp4":  lambda: _shared(VideoExtractor),
+        "mov":  lambda: _shared(VideoExtractor),
+        "mkv":  lambda: _shared(VideoExtractor),
     })
 
 # Public registry (users/tests may monkeypatch this!)
@@ -227,20 +260,30 @@ def detect_extractor(path: Union[str, Path]) -> Optional[str]:
     return ext if ext in REGISTRY else None
 
 
+_COLUMNS = [
+    "source_path", "source_name", "file_type", "unit_type", "unit_id",
+    "content", "char_count", "metadata", "status", "error"
+]
+
+
 def _rows_to_df(rows: List[Row]) -> pd.DataFrame:
     """
     Convert a list of Row to the standardized pandas DataFrame.
+
+    Row attributes are gathered straight into one list per column, skipping
+    the per-row ``to_dict()`` and pandas' record-to-column reshaping. Other
+    row-likes (anything with a ``to_dict()``) take the record path.
     """
-    data = [r.to_dict() for r in rows]
-    cols = [
-        "source_path", "source_name", "file_type", "unit_type", "unit_id",
-        "content", "char_count", "metadata", "status", "error"
-    ]
-    df = pd.DataFrame(data)
-    for c in cols:
-        if c not in df.columns:
-            df[c] = None
-    return df[cols]
+    if not rows or not all(isinstance(r, Row) for r in rows):
+        df = pd.DataFrame([r.to_dict() for r in rows])
+        for c in _COLUMNS:
+            if c not in df.columns:
+                df[c] = None
+        return df[_COLUMNS]
+
+    data = {c: [getattr(r, c) for r in rows] for c in _COLUMNS}
+    data["metadata"] = [_safe_metadata(m) for m in data["metadata"]]
+    return pd.DataFrame(data, columns=_COLUMNS)
 
 
 def _apply_runtime_to_instance(extractor) -> None:
@@ -274,6 +317,7 @@ def extract_to_table(
     asr_model: Optional[str] = None,
     asr_device: Optional[str] = None,
     asr_compute_type: Optional[str] = None,
+    reuse_extractors: Optional[bool] = None,
 ) -> pd.DataFrame:
     """
     Extract text from a supported file and return a standardized pandas DataFrame.
@@ -285,6 +329,7 @@ def extract_to_table(
         asr_model=asr_model,
         asr_device=asr_device,
         asr_compute_type=asr_compute_type,
+        reuse_extractors=reuse_extractors,
     )
 
     # Resolve to a real file path
@@ -6,9 +6,13 @@ from typing import Callable
 import re
 import pandas as pd
 
+# Compiled once at import rather than looked up in re's cache on every call
+_RE_TRAILING_SPACES = re.compile(r"[ \t]+\n")
+
 def clean_whitespace(text: str) -> str:
     if not isinstance(text, str): return ""
-    return re.sub(r"[ \t]+\n", "\n", re.sub(r"\s+\Z", "", text)).replace("\r\n", "\n").replace("\r", "\n")
+    # rstrip() strips exactly what r"\s+\Z" matched, without the regex backtracking
+    return _RE_TRAILING_SPACES.sub("\n", text.rstrip()).replace("\r\n", "\n").replace("\r", "\n")
 
 def add_language(df: pd.DataFrame, detector: Callable[[str], str]) -> pd.DataFrame:
     # Adds 'lang' column using a user-provided detector, e.g., langid.classify
@@ -24,23 +28,28 @@ def add_language(df: pd.DataFrame, detector: Callable[[str], str]) -> pd.DataFra
 
 def chunk_content(df: pd.DataFrame, max_chars: int = 4000, overlap: int = 200) -> pd.DataFrame:
     # Splits each row's content into chunks; preserves all metadata; adds chunk_id
+    # Column lists + plain dicts instead of iterrows(): no per-row Series copies
+    cols = df.to_dict(orient="list")
+    step = max(1, max_chars - overlap)
     rows = []
-    for _, r in df.iterrows():
-        text = r["content"] or ""
-        start = 0; i = 0
-        while start < len(text):
-            end = min(len(text), start + max_chars)
-            chunk = text[start:end]
-            rr = r.copy()
-            rr["content"] = chunk
-            rr["char_count"] = len(chunk)
-            rr["unit_type"] = f"{r['unit_type']}:chunk"
-            rr["unit_id"] = f"{r['unit_id']}:{i}"
-            rows.append(rr)
-            i += 1
-            start = end - overlap
-            if start < 0: start = 0
-    return pd.DataFrame(rows, columns=df.columns)
+    for i in range(len(df)):
+        base = {k: v[i] for k, v in cols.items()}
+        text = base["content"] or ""
+        unit_type = f"{base['unit_type']}:chunk"
+        # Windows advance by a fixed stride (>= 1), so this always terminates,
+        # even when overlap >= max_chars; stop once a window reaches the end
+        for j, start in enumerate(range(0, len(text), step)):
+            chunk = text[start:start + max_chars]
+            rows.append({
+                **base,
+                "content": chunk,
+                "char_count": len(chunk),
+                "unit_type": unit_type,
+                "unit_id": f"{base['unit_id']}:{j}",
+            })
+            if start + max_chars >= len(text):
+                break
+    return pd.DataFrame.from_records(rows, columns=df.columns)
 
 def summarize(df: pd.DataFrame, summarizer: Callable[[str], str], max_chars: int = 6000) -> pd.DataFrame:
     # New dataframe with 'summary' column; leaves original content intact
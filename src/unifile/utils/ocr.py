@@ -0,0 +1,38 @@
+# Copyright (c) 2025 takotime808
+"""
+Shared OCR helpers.
+
+Optional in-process Tesseract (``pip install ".[ocr]"``): when ``tesserocr``
+is importable, each thread keeps one resident Tesseract API per language, so
+the language model is loaded once per worker instead of once per
+``tesseract`` subprocess run. Used by the PDF and image extractors.
+"""
+
+from __future__ import annotations
+
+import threading
+
+try:
+    from tesserocr import PyTessBaseAPI
+    HAVE_TESSEROCR = True
+except Exception:
+    PyTessBaseAPI = None
+    HAVE_TESSEROCR = False
+
+_TESS = threading.local()
+
+
+def tess_api(lang: str):
+    """
+    This thread's resident tesserocr API for ``lang``.
+
+    The API's C state is not thread-safe, so instances are never shared
+    between threads. Requires :data:`HAVE_TESSEROCR`.
+    """
+    apis = getattr(_TESS, "apis", None)
+    if apis is None:
+        apis = _TESS.apis = {}
+    api = apis.get(lang)
+    if api is None:
+        api = apis[lang] = PyTessBaseAPI(lang=lang)
+    return api
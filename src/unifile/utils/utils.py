@@ -4,10 +4,22 @@ from __future__ import annotations
 
 import os
 import io
+import re
 import json
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Any, Optional, Tuple, Union
+
+# Optional fast decoder (pip install ".[json]")
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    orjson = None
+    HAVE_ORJSON = False
+
+# 19+ digit runs may be integers beyond 64 bits, which orjson reads as floats
+_RE_LONG_DIGITS = re.compile(rb"\d{19,}")
 
 def write_temp_file(data: Union[bytes, io.BufferedReader, io.BytesIO], suffix: str) -> Path:
     """
@@ -102,6 +114,41 @@ def json_dumps_safe(obj) -> str:
     except Exception:
         return json.dumps(str(obj), ensure_ascii=False)
 
+def json_loads_safe(data: bytes) -> Any:
+    """
+    Parse JSON bytes with orjson when installed, else with :func:`json.loads`.
+
+    orjson is stricter than the standard library: it rejects ``NaN`` and
+    invalid UTF-8 and loses precision on integers wider than 64 bits. Such
+    input is re-parsed by ``json.loads`` from text decoded with
+    ``errors="replace"``, so the result never depends on orjson being
+    installed.
+
+    Parameters
+    ----------
+    data
+        Raw JSON document (e.g. file contents or subprocess output).
+
+    Returns
+    -------
+    Any
+        The decoded object. Raises :class:`ValueError` (``JSONDecodeError``)
+        when neither parser accepts the input.
+
+    Examples
+    --------
+    >>> json_loads_safe(b'{"a": NaN}')
+    {'a': nan}
+    >>> json_loads_safe(b"[123456789012345678901234567890]")
+    [123456789012345678901234567890]
+    """
+    if HAVE_ORJSON and not _RE_LONG_DIGITS.search(data):
+        try:
+            return orjson.loads(data)
+        except Exception:
+            pass
+    return json.loads(data.decode("utf-8", errors="replace"))
+
 def norm_ext(p: Union[str, Path]) -> str:
     """
     Normalize a file's extension to lowercase without the leading dot.
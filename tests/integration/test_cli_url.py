@@ -9,20 +9,32 @@ cli = pytest.importorskip("cli_unifile.cli")
 import cli_unifile.cli as mod
 from .utils_build_samples import build_pdf
 
+
+class Resp:
+    """Minimal stand-in for a streamed ``requests.Response``."""
+    def __init__(self, content, headers=None):
+        self.content = content
+        self.headers = headers or {}
+    def raise_for_status(self): pass
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+
 def test_cli_url_download_and_extract(tmp_path, monkeypatch):
-    # Craft a small PDF in temp and serve its bytes via mocked requests.get
+    # Craft a small PDF in temp and serve its bytes via a mocked requests session
     sample = tmp_path / "sample.pdf"
     build_pdf(sample)
     data = sample.read_bytes()
 
-    class Resp:
-        def __init__(self, content): self.content = content
-        def raise_for_status(self): pass
-
-    def fake_get(url, timeout=60): return Resp(data)
+    def fake_get(url, timeout=60, stream=False): return Resp(data)
 
     requests = pytest.importorskip("requests")
-    monkeypatch.setattr(mod, "requests", types.SimpleNamespace(get=fake_get))
+    session = types.SimpleNamespace(get=fake_get, close=lambda: None)
+    monkeypatch.setattr(mod, "requests", types.SimpleNamespace(Session=lambda: session))
+    monkeypatch.setattr(mod, "_SESSION", None)
 
     out = tmp_path / "o.jsonl"
     rc = cli.main(["extract", "https://example.com/sample.pdf", "--out", str(out)])
@@ -35,3 +47,95 @@ def test_cli_url_download_and_extract(tmp_path, monkeypatch):
     assert obj["unit_type"] == "page"
     assert obj["status"] == "ok"
 
+
+def test_cli_download_reuses_session_and_streams(tmp_path, monkeypatch):
+    created = []
+    payload = b"0123456789" * 20000  # spans several 64 KiB chunks
+
+    def make_session():
+        s = types.SimpleNamespace(get=lambda url, timeout=60, stream=False: Resp(payload),
+                                  close=lambda: None)
+        created.append(s)
+        return s
+
+    monkeypatch.setattr(mod, "requests", types.SimpleNamespace(Session=make_session))
+    monkeypatch.setattr(mod, "_SESSION", None)
+
+    a = mod._download("https://example.com/a.txt", tmp_path / "a.txt")
+    mod._download("https://example.com/b.txt", tmp_path / "b.txt")
+    assert len(created) == 1
+    assert a.read_bytes() == payload
+
+
+@pytest.mark.parametrize(
+    "ctype,expected",
+    [("text/html; charset=utf-8", "page.html"), ("application/octet-stream", None)],
+)
+def test_cli_download_uses_content_type_for_extensionless_urls(tmp_path, monkeypatch, ctype, expected):
+    body_read = []
+
+    class TrackingResp(Resp):
+        def iter_content(self, chunk_size=1):
+            body_read.append(True)
+            return super().iter_content(chunk_size)
+
+    session = types.SimpleNamespace(
+        get=lambda url, timeout=60, stream=False: TrackingResp(b"<p>hi</p>", {"Content-Type": ctype}),
+        close=lambda: None,
+    )
+    monkeypatch.setattr(mod, "requests", types.SimpleNamespace(Session=lambda: session))
+    monkeypatch.setattr(mod, "_SESSION", None)
+
+    if expected is None:
+        # Unsupported types fail on the headers alone, before the body is read
+        with pytest.raises(ValueError, match="Unsupported download"):
+            mod._download("https://example.com/page", tmp_path / "page")
+        assert not body_read
+    else:
+        out = mod._download("https://example.com/page", tmp_path / "page")
+        assert out.name == expected and out.read_bytes() == b"<p>hi</p>"
+
+
+def test_cli_download_aborts_past_max_bytes(tmp_path, monkeypatch):
+    chunks_read = []
+
+    class CountingResp(Resp):
+        def iter_content(self, chunk_size=1):
+            for chunk in super().iter_content(chunk_size):
+                chunks_read.append(len(chunk))
+                yield chunk
+
+    payload = b"x" * (64 * 1024 * 4)
+    session = types.SimpleNamespace(
+        get=lambda url, timeout=60, stream=False: CountingResp(payload),
+        close=lambda: None,
+    )
+    monkeypatch.setattr(mod, "requests", types.SimpleNamespace(Session=lambda: session))
+    monkeypatch.setattr(mod, "_SESSION", None)
+
+    out = tmp_path / "big.txt"
+    with pytest.raises(ValueError, match="exceeds"):
+        mod._download("https://example.com/big.txt", out, max_bytes=100 * 1024)
+    # Stopped after the chunk that crossed the limit; partial file removed
+    assert len(chunks_read) == 2
+    assert not out.exists()
+
+    # A declared Content-Length over the cap is rejected before reading the body
+    chunks_read.clear()
+    session.get = lambda url, timeout=60, stream=False: CountingResp(payload, {"Content-Length": str(len(payload))})
+    with pytest.raises(ValueError, match="exceeds"):
+        mod._download("https://example.com/big.txt", out, max_bytes=100 * 1024)
+    assert not chunks_read
+
+
+def test_save_df_parquet_mixed_metadata(tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame([
+        {"unit_id": "1", "metadata": {"page": 1}},
+        {"unit_id": "2", "metadata": {"page": "x", "k": [1]}},
+    ])
+    out = tmp_path / "t.parquet"
+    mod._save_df(df, out)
+    back = pd.read_parquet(out)
+    assert [json.loads(m) for m in back["metadata"]] == [{"page": 1}, {"page": "x", "k": [1]}]
@@ -44,3 +44,76 @@ def test_video_extractor_end_to_end_with_mocks(tmp_path, monkeypatch):
     assert row["metadata"]["probe"]["format"] == "mp4"
     assert isinstance(row["metadata"]["probe"]["video_streams"], list)
     assert isinstance(row["metadata"]["probe"]["audio_streams"], list)
+
+
+def test_ffprobe_result_cached_per_file_version(tmp_path, monkeypatch):
+    import os
+    from unifile.extractors import audio_extractor as ae
+    calls = []
+    monkeypatch.setattr(ae.subprocess, "check_output", lambda cmd, **kw: calls.append(cmd) or b'{"format":{"format_name":"wav"}}')
+    ae._ffprobe_json.cache_clear()
+
+    wav = tmp_path / "a.wav"
+    wav.write_bytes(b"RIFF")
+    assert ae._probe_media(wav)["format"]["format_name"] == "wav"
+    assert ae._probe_media(wav)["format"]["format_name"] == "wav"
+    assert len(calls) == 1
+    # A modified file is probed again
+    os.utime(wav, ns=(0, 10**9))
+    ae._probe_media(wav)
+    assert len(calls) == 2
+    ae._ffprobe_json.cache_clear()
+
+
+def test_ffprobe_cache_hands_out_copies_and_skips_failures(tmp_path, monkeypatch):
+    from unifile.extractors import audio_extractor as ae
+    calls = []
+
+    def check_output(cmd, **kw):
+        calls.append(cmd)
+        if len(calls) == 1:
+            raise FileNotFoundError("ffprobe")
+        return b'{"streams":[{"codec_type":"audio"}]}'
+    monkeypatch.setattr(ae.subprocess, "check_output", check_output)
+    ae._ffprobe_json.cache_clear()
+
+    wav = tmp_path / "a.wav"
+    wav.write_bytes(b"RIFF")
+    # A failed probe is not cached
+    assert ae._probe_media(wav) == {}
+    first = ae._probe_media(wav)
+    assert len(calls) == 2
+    # Mutating one result does not leak into later ones
+    first["streams"][0]["codec_type"] = "mutated"
+    assert ae._probe_media(wav)["streams"][0]["codec_type"] == "audio"
+    assert len(calls) == 2
+    ae._ffprobe_json.cache_clear()
+
+
+def test_video_extractor_decodes_audio_in_process_with_pyav(tmp_path, monkeypatch):
+    av = pytest.importorskip("av")
+    np = pytest.importorskip("numpy")
+    from unifile.extractors import video_extractor as ve
+
+    # One second of 44.1 kHz stereo tone in a Matroska container
+    mkv = tmp_path / "tone.mkv"
+    with av.open(str(mkv), "w") as out:
+        stream = out.add_stream("pcm_s16le", rate=44100)
+        stream.layout = "stereo"
+        tone = (np.sin(2 * np.pi * 440 * np.arange(44100) / 44100) * 10000).astype(np.int16)
+        frame = av.AudioFrame.from_ndarray(np.repeat(tone, 2).reshape(1, -1), format="s16", layout="stereo")
+        frame.sample_rate = 44100
+        for packet in [*stream.encode(frame), *stream.encode(None)]:
+            out.mux(packet)
+
+    seen = []
+    from unifile.extractors.audio_extractor import _ASR
+    monkeypatch.setattr(_ASR, "transcribe", staticmethod(lambda a: seen.append(a) or ("tone", {"segments": []})))
+    monkeypatch.setattr(ve, "_ffmpeg_audio", lambda p: pytest.fail("ffmpeg should not be needed"))
+    monkeypatch.setattr(ve, "_probe_video", lambda p: {})
+
+    rows = ve.VideoExtractor().extract(mkv)
+    assert rows[0].status == "ok" and rows[0].content == "tone"
+    (samples,) = seen
+    assert samples.dtype == np.float32 and samples.ndim == 1
+    assert abs(len(samples) - 16000) < 100 and 0.2 < float(np.abs(samples).max()) <= 1.0
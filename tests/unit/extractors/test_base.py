@@ -86,3 +86,23 @@ def test_extractor_protocol_definition():
     assert hasattr(ext, "supported_extensions")
     assert callable(ext.extract)
     assert isinstance(ext.extract(Path("file.txt")), list)
+
+
+def test_row_factory_matches_make_row(tmp_path):
+    f = tmp_path / "doc.pdf"
+    f.write_bytes(b"%PDF")
+    make = base.row_factory(f, "pdf")
+    assert make("page", 3, "text", {"page": 3}) == base.make_row(f, "pdf", "page", "3", "text", {"page": 3})
+    err = make("page", "0", None, None, status="error", error="boom")
+    assert err == base.make_row(f, "pdf", "page", "0", None, None, status="error", error="boom")
+    assert err.content == "" and err.metadata == {}
+
+
+def test_row_to_dict_covers_all_fields_in_order(tmp_path):
+    from dataclasses import fields
+    f = tmp_path / "x.txt"
+    f.write_text("ok")
+    row = base.make_row(f, "txt", "file", "0", "ok", {"nested": {"k": [1, 2]}})
+    d = row.to_dict()
+    assert list(d) == [fld.name for fld in fields(base.Row)]
+    assert d["metadata"] == {"nested": {"k": [1, 2]}}
@@ -17,3 +17,24 @@ def test_make_row_dict_serializable(tmp_path):
     assert d["status"] == "ok"
     # metadata must be JSON serializable
     json.dumps(d["metadata"])
+
+def test_to_dict_metadata_fallback_matches_json_dumps(tmp_path):
+    p = tmp_path / "f.txt"
+    p.write_text("x")
+    circular = []
+    circular.append(circular)
+    cases = [
+        {"a": [1, 2.5, None, True, ("t", {"n": "s"})], 3: "int key"},
+        {"bad": {1, 2}},
+        {(1, 2): "tuple key"},
+        {"obj": object()},
+        {"circ": circular},
+    ]
+    for md in cases:
+        try:
+            json.dumps(md)
+            expected = md
+        except Exception:
+            expected = {"_repr": str(md)}
+        d = make_row(p, "txt", "file", "body", "c", md).to_dict()
+        assert d["metadata"] == expected
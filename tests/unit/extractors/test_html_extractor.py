@@ -13,3 +13,25 @@ def test_html_extractor_gets_visible_text(simple_html):
     assert r.file_type in {"html", "htm"}
     assert "Header" in r.content
     assert "Hello" in r.content
+
+def test_html_extractor_lxml_walk_matches_bs4():
+    from unifile.extractors.html_extractor import _html_text, _html_text_bs4, _html_text_lxml
+    html = (
+        "<html><head><title>T</title><style>p{}</style></head><body>\n"
+        "  <h1>Header</h1><p>Hello<br>world <b>bold</b><!-- c --> tail</p>\n"
+        "  <script>var x = 1;</script><template><p>hidden</p></template>\n"
+        "  <pre>  keep\n  </pre><p>a &amp; b </p>\n"
+        "</body></html>"
+    )
+    assert _html_text_lxml(html) == _html_text_bs4(html)
+    assert _html_text(html) == _html_text_bs4(html)
+
+    # lxml's tree drops whatever follows </html>; those documents go to bs4
+    for html in (
+        "<html><body>a</body></html>trailing",
+        "<html><body>a</body></html>\n<p>late</p>",
+        "<html><body>a</body></html><!-- c -->x",
+        "<p>a</p></body>b</HTML >c",
+    ):
+        assert _html_text(html) == _html_text_bs4(html)
+    assert _html_text("<html><body>a</body></html>trailing")[0] == "a\ntrailing"
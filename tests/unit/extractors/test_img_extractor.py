@@ -21,6 +21,7 @@ def test_image_extractor_uses_ocr(tmp_path, monkeypatch):
     def fake_ocr(img, lang="eng"):
         return "HELLO MOCK"
     monkeypatch.setattr(mod, "pytesseract", type("X", (), {"image_to_string": staticmethod(fake_ocr)}))
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
 
     ext = ImageExtractor()
     rows = ext.extract(p)
@@ -28,3 +29,131 @@ def test_image_extractor_uses_ocr(tmp_path, monkeypatch):
     assert "HELLO" in rows[0].content
     assert rows[0].metadata["width"] == 200
     assert rows[0].metadata["height"] == 80
+
+def test_image_extractor_batch_preserves_order(tmp_path, monkeypatch):
+    paths = []
+    for name in ("a.png", "b.png"):
+        p = tmp_path / name
+        _build_image(p)
+        paths.append(p)
+
+    def fake_ocr(img, lang="eng"):
+        return "HELLO MOCK"
+    monkeypatch.setattr(mod, "pytesseract", type("X", (), {"image_to_string": staticmethod(fake_ocr)}))
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+
+    results = ImageExtractor().extract_batch(paths, max_workers=1)
+    assert [r[0].source_name for r in results] == ["a.png", "b.png"]
+    assert all(r[0].status == "ok" for r in results)
+
+@pytest.mark.parametrize("env, expected", [
+    ({}, "1"),
+    ({"OMP_THREAD_LIMIT": "4"}, "4"),
+    ({"UNIFILE_TESSERACT_OMP": "1"}, ""),
+])
+def test_image_extractor_batch_workers_respect_omp_settings(tmp_path, monkeypatch, env, expected):
+    paths = []
+    for name in ("a.png", "b.png", "c.png"):
+        p = tmp_path / name
+        _build_image(p)
+        paths.append(p)
+
+    # Report the worker's OpenMP limit as the OCR text
+    def fake_ocr(img, lang="eng"):
+        import os
+        return os.environ.get("OMP_THREAD_LIMIT", "")
+    monkeypatch.setattr(mod, "pytesseract", type("X", (), {"image_to_string": staticmethod(fake_ocr)}))
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    monkeypatch.delenv("UNIFILE_TESSERACT_OMP", raising=False)
+    for k, v in env.items():
+        monkeypatch.setenv(k, v)
+
+    results = ImageExtractor().extract_batch(paths, max_workers=2)
+    assert [r[0].source_name for r in results] == ["a.png", "b.png", "c.png"]
+    assert [r[0].content for r in results] == [expected] * 3
+
+def test_image_extractor_passes_path_or_converted_image(tmp_path, monkeypatch):
+    rgb = tmp_path / "rgb.png"
+    _build_image(rgb)
+    rgba = tmp_path / "rgba.png"
+    img = Image.new("RGBA", (200, 80), (255, 255, 255, 255))
+    ImageDraw.Draw(img).text((10, 30), "HELLO", fill=(0, 0, 0, 255))
+    img.save(rgba)
+
+    seen = []
+    def fake_ocr(img, lang="eng"):
+        seen.append(img)
+        return ""
+    monkeypatch.setattr(mod, "pytesseract", type("X", (), {"image_to_string": staticmethod(fake_ocr)}))
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+
+    ext = ImageExtractor()
+    ext.extract(rgb)
+    ext.extract(rgba)
+    # Plain RGB PNG goes straight to Tesseract by path; RGBA is converted first
+    assert seen[0] == str(rgb)
+    assert isinstance(seen[1], Image.Image) and seen[1].mode == "RGB"
+
+def test_image_extractor_skips_ocr_for_blank_image(tmp_path, monkeypatch):
+    # RGBA is converted (decoded) before OCR, so the blank check is free
+    p = tmp_path / "blank.png"
+    Image.new("RGBA", (400, 400), (255, 255, 255, 255)).save(p)
+
+    def fail_ocr(img, lang="eng"):
+        raise AssertionError("OCR should not run on a blank image")
+    monkeypatch.setattr(mod, "pytesseract", type("X", (), {"image_to_string": staticmethod(fail_ocr)}))
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+
+    rows = ImageExtractor().extract(p)
+    assert rows[0].status == "ok"
+    assert rows[0].content == ""
+    assert rows[0].metadata["ocr_skipped"] == "blank"
+
+
+def test_image_extractor_reuses_tesserocr_api(tmp_path, monkeypatch):
+    import threading
+    import unifile.utils.ocr as ocr_mod
+    png = tmp_path / "a.png"
+    _build_image(png)
+    rgba = tmp_path / "b.png"
+    img = Image.new("RGBA", (200, 80), (255, 255, 255, 255))
+    ImageDraw.Draw(img).text((10, 30), "HELLO", fill=(0, 0, 0, 255))
+    img.save(rgba)
+
+    created, inputs = [], []
+
+    class FakeApi:
+        def __init__(self, lang):
+            created.append(lang)
+        def SetImageFile(self, src):
+            inputs.append(src)
+        def SetImage(self, image):
+            inputs.append(image.mode)
+        def GetUTF8Text(self):
+            return "HELLO API"
+
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", True)
+    monkeypatch.setattr(ocr_mod, "PyTessBaseAPI", FakeApi)
+    monkeypatch.setattr(ocr_mod, "_TESS", threading.local())
+
+    ext = ImageExtractor(ocr_lang="eng")
+    assert [ext.extract(p)[0].content for p in (png, rgba)] == ["HELLO API", "HELLO API"]
+    assert created == ["eng"]
+    assert inputs == [str(png), "RGB"]
+
+
+def test_image_extractor_path_input_skips_blank_check(tmp_path, monkeypatch):
+    # Plain RGB PNGs go to Tesseract by path; PIL must not decode them first
+    p = tmp_path / "blank.png"
+    Image.new("RGB", (400, 400), (255, 255, 255)).save(p)
+
+    def no_decode(img):
+        raise AssertionError("blank check should not decode path inputs")
+    monkeypatch.setattr(mod, "_is_blank", no_decode)
+    monkeypatch.setattr(mod, "pytesseract", type("X", (), {"image_to_string": staticmethod(lambda src, lang="eng": "")}))
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+
+    rows = ImageExtractor().extract(p)
+    assert rows[0].status == "ok"
+    assert "ocr_skipped" not in rows[0].metadata
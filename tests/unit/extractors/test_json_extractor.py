@@ -0,0 +1,92 @@
+# Copyright (c) 2025 takotime808
+
+import json
+
+from unifile.extractors.json_extractor import JsonExtractor, _flatten
+
+
+def test_flatten_preserves_document_order():
+    obj = {"a": {"b": 1, "c": [10, {"d": "x"}]}, "e": None, "f": {}}
+    assert list(_flatten(obj)) == [
+        ("a.b", 1),
+        ("a.c.0", 10),
+        ("a.c.1.d", "x"),
+        ("e", None),
+    ]
+
+
+def test_flatten_scalar_root():
+    assert list(_flatten(5)) == [("", 5)]
+
+
+def test_json_extractor_flattens_object(tmp_path):
+    p = tmp_path / "sample.json"
+    p.write_text(json.dumps({"name": "unifile", "tags": ["a", "b"]}))
+    rows = JsonExtractor().extract(p)
+    assert len(rows) == 1
+    r = rows[0]
+    assert r.metadata == {"format": "json"}
+    assert r.content.splitlines() == ["name=unifile", "tags.0=a", "tags.1=b"]
+
+
+def test_json_extractor_invalid_json_falls_back_to_text(tmp_path):
+    p = tmp_path / "broken.json"
+    p.write_bytes(b"[1, 2,")
+    rows = JsonExtractor().extract(p)
+    assert rows[0].status == "ok"
+    assert rows[0].metadata == {"format": "text"}
+    assert rows[0].content == "[1, 2,"
+
+
+def test_json_extractor_streams_ndjson_records(tmp_path):
+    p = tmp_path / "events.json"
+    p.write_text('{"id": 1, "tags": ["a"]}\n\nnot json\n{"id": 2}\n')
+    rows = JsonExtractor().extract(p)
+    r = rows[0]
+    assert r.metadata == {"format": "ndjson", "records": 2, "invalid_lines": 1}
+    assert r.content.splitlines() == ["0.id=1", "0.tags.0=a", "1.id=2"]
+
+
+def test_json_extractor_ndjson_record_cap(tmp_path):
+    p = tmp_path / "events.json"
+    p.write_text("\n".join(json.dumps({"i": i}) for i in range(5)))
+    r = JsonExtractor(max_ndjson_records=2).extract(p)[0]
+    assert r.metadata["records"] == 2 and r.metadata["truncated"] is True
+    assert r.content.splitlines() == ["0.i=0", "1.i=1"]
+
+
+def test_json_extractor_pretty_printed_object_is_not_ndjson(tmp_path):
+    p = tmp_path / "pretty.json"
+    p.write_text(json.dumps({"a": {"b": 1}}, indent=2))
+    r = JsonExtractor().extract(p)[0]
+    assert r.metadata == {"format": "json"}
+    assert r.content == "a.b=1"
+
+
+def test_json_extractor_parses_what_stdlib_json_accepts(tmp_path):
+    # NaN, invalid UTF-8 and >64-bit integers must flatten the same way with
+    # or without orjson installed
+    p = tmp_path / "lenient.json"
+    p.write_bytes(b'{"a": NaN, "b": "caf\xe9", "c": 123456789012345678901234567890}')
+    r = JsonExtractor().extract(p)[0]
+    assert r.metadata == {"format": "json"}
+    assert r.content == "a=nan\nb=caf�\nc=123456789012345678901234567890"
+
+    p = tmp_path / "events.json"
+    p.write_text('{"a": NaN}\n{"a": 1}\n')
+    r = JsonExtractor().extract(p)[0]
+    assert r.metadata == {"format": "ndjson", "records": 2}
+
+
+def test_json_extractor_minified_document_parsed_once(tmp_path, monkeypatch):
+    import unifile.extractors.json_extractor as mod
+    calls = []
+    real = mod.json_loads_safe
+    monkeypatch.setattr(mod, "json_loads_safe", lambda data: calls.append(len(data)) or real(data))
+
+    p = tmp_path / "min.json"
+    p.write_text("\n" + json.dumps({"a": [1, 2], "b": {"c": "d"}}) + "\n\n")
+    r = JsonExtractor().extract(p)[0]
+    assert r.metadata == {"format": "json"}
+    assert r.content == "a.0=1\na.1=2\nb.c=d"
+    assert len(calls) == 1
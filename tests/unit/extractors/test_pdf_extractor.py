@@ -1,6 +1,7 @@
 # Copyright (c) 2025 takotime808
 
 import os
+import threading
 import pytest
 import fitz  # PyMuPDF
 from pathlib import Path
@@ -30,3 +31,201 @@ def test_pdf_extractor_vector_text(tmp_path, monkeypatch):
     meta_rows = [r for r in rows if r.unit_type == "file"]
     for mr in meta_rows:
         assert mr.unit_id in {"meta"}
+
+
+def _build_scanned_pdf(path: Path, pages: int = 3, text_page: int = 1):
+    """Pages hold only an embedded image (like a scan), except one text page."""
+    from PIL import Image
+    import io
+    buf = io.BytesIO()
+    Image.new("RGB", (60, 20), (0, 0, 0)).save(buf, format="PNG")
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        if i == text_page:
+            page.insert_text((72, 72), "Native text")
+        else:
+            page.insert_image(fitz.Rect(72, 72, 192, 112), stream=buf.getvalue())
+    doc.save(str(path))
+    doc.close()
+
+
+class FakeTesseract:
+    """Mimics Tesseract: list-file inputs yield one form-feed-terminated page per image."""
+    def __init__(self):
+        self.inputs = []
+        self.langs = []
+
+    def image_to_string(self, src, lang="eng"):
+        src = Path(src)
+        self.inputs.append(src)
+        self.langs.append(lang)
+        images = src.read_text().split() if src.name.endswith(".list.txt") else [src]
+        return "".join(f"OCR {Path(img).stem}\f" for img in images)
+
+
+def test_pdf_extractor_ocr_fallback_keeps_page_order(tmp_path, monkeypatch):
+    import unifile.extractors.pdf_extractor as mod
+    p = tmp_path / "scan.pdf"
+    _build_scanned_pdf(p, pages=4, text_page=1)
+
+    fake = FakeTesseract()
+    monkeypatch.setattr(mod, "pytesseract", fake)
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+    monkeypatch.delenv("UNIFILE_DISABLE_PDF_OCR", raising=False)
+    monkeypatch.delenv("UNIFILE_OCR_LANG", raising=False)
+    monkeypatch.setenv("UNIFILE_OCR_CONCURRENCY", "2")
+    monkeypatch.setenv("UNIFILE_OCR_BATCH_SIZE", "2")
+
+    rows = PdfExtractor(ocr_lang="deu").extract(p)
+    pages = [r for r in rows if r.unit_type == "page"]
+    assert [r.unit_id for r in pages] == ["0", "1", "2", "3"]
+    assert [r.metadata["ocr"] for r in pages] == [True, False, True, True]
+    assert "Native text" in pages[1].content
+    assert [pages[i].content for i in (0, 2, 3)] == ["OCR 0", "OCR 2", "OCR 3"]
+    # Pages 0 and 2 share one batched run; page 3 runs alone
+    assert len(fake.inputs) == 2 and fake.inputs[0].name.endswith(".list.txt")
+    assert fake.langs == ["deu", "deu"]
+    assert rows[-1].unit_id == "meta"
+    # Rasterized pages live in a temp dir that is removed afterwards
+    assert not fake.inputs[0].parent.exists()
+
+
+def test_pdf_extractor_short_batch_falls_back_per_page(tmp_path, monkeypatch):
+    import unifile.extractors.pdf_extractor as mod
+    p = tmp_path / "scan.pdf"
+    _build_scanned_pdf(p, pages=3, text_page=-1)
+
+    class DroppingTesseract(FakeTesseract):
+        # A batched run that loses its last page
+        def image_to_string(self, src, lang="eng"):
+            out = super().image_to_string(src, lang)
+            if Path(src).name.endswith(".list.txt"):
+                out = out[: out.rindex("OCR ")]
+            return out
+
+    fake = DroppingTesseract()
+    monkeypatch.setattr(mod, "pytesseract", fake)
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+    monkeypatch.delenv("UNIFILE_DISABLE_PDF_OCR", raising=False)
+    monkeypatch.setenv("UNIFILE_OCR_CONCURRENCY", "1")
+    monkeypatch.setenv("UNIFILE_OCR_BATCH_SIZE", "3")
+
+    rows = PdfExtractor().extract(p)
+    pages = [r for r in rows if r.unit_type == "page"]
+    assert [r.content for r in pages] == ["OCR 0", "OCR 1", "OCR 2"]
+    # One batched run, then one run per page
+    assert len(fake.inputs) == 4
+
+
+def test_pdf_extractor_ocr_failure_becomes_error_row(tmp_path, monkeypatch):
+    import unifile.extractors.pdf_extractor as mod
+    p = tmp_path / "scan.pdf"
+    _build_scanned_pdf(p, pages=2, text_page=-1)
+
+    def boom(src, lang="eng"):
+        raise RuntimeError("tesseract missing")
+    monkeypatch.setattr(mod, "pytesseract", type("X", (), {"image_to_string": staticmethod(boom)}))
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+    monkeypatch.delenv("UNIFILE_DISABLE_PDF_OCR", raising=False)
+
+    rows = PdfExtractor().extract(p)
+    pages = [r for r in rows if r.unit_type == "page"]
+    assert [r.status for r in pages] == ["error", "error"]
+    assert pages[0].metadata["warning"] == "OCR failed"
+    assert "tesseract missing" in pages[0].error
+
+
+def test_pdf_extractor_blank_page_skips_ocr(tmp_path, monkeypatch):
+    import unifile.extractors.pdf_extractor as mod
+    p = tmp_path / "blank.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(str(p))
+    doc.close()
+
+    fake = FakeTesseract()
+    monkeypatch.setattr(mod, "pytesseract", fake)
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+    monkeypatch.delenv("UNIFILE_DISABLE_PDF_OCR", raising=False)
+
+    rows = PdfExtractor().extract(p)
+    pages = [r for r in rows if r.unit_type == "page"]
+    assert [(r.content, r.status, r.metadata["ocr"]) for r in pages] == [("", "ok", False)]
+    assert fake.inputs == []
+
+
+def test_ocr_zoom_caps_pixels_for_large_pages(monkeypatch):
+    from unifile.extractors.pdf_extractor import _ocr_zoom
+    monkeypatch.delenv("UNIFILE_OCR_ZOOM", raising=False)
+    letter, a1 = fitz.Rect(0, 0, 612, 792), fitz.Rect(0, 0, 1684, 2384)
+    assert _ocr_zoom(letter) == 2.0
+    z = _ocr_zoom(a1)
+    assert z < 1.0 and a1.width * a1.height * z * z <= 4_000_000 * 1.0001
+    monkeypatch.setenv("UNIFILE_OCR_ZOOM", "3")
+    assert _ocr_zoom(a1) == 3.0
+
+
+def test_pdf_extractor_reuses_tesserocr_api_per_thread(tmp_path, monkeypatch):
+    import unifile.extractors.pdf_extractor as mod
+    p = tmp_path / "scan.pdf"
+    _build_scanned_pdf(p, pages=3, text_page=-1)
+
+    created = []
+
+    class FakeApi:
+        def __init__(self, lang):
+            created.append(lang)
+        def SetImageFile(self, src):
+            self.src = src
+        def GetUTF8Text(self):
+            return f"OCR {Path(self.src).stem}"
+
+    import unifile.utils.ocr as ocr_mod
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", True)
+    monkeypatch.setattr(ocr_mod, "PyTessBaseAPI", FakeApi)
+    monkeypatch.setattr(ocr_mod, "_TESS", threading.local())
+    monkeypatch.delenv("UNIFILE_DISABLE_PDF_OCR", raising=False)
+    monkeypatch.setenv("UNIFILE_OCR_CONCURRENCY", "1")
+
+    rows = PdfExtractor(ocr_lang="eng").extract(p)
+    pages = [r for r in rows if r.unit_type == "page"]
+    assert [r.content for r in pages] == ["OCR 0", "OCR 1", "OCR 2"]
+    assert created == ["eng"]
+
+
+def test_omp_thread_limit_scoped_to_concurrent_ocr(tmp_path, monkeypatch):
+    import unifile.extractors.pdf_extractor as mod
+    p = tmp_path / "scan.pdf"
+    _build_scanned_pdf(p, pages=2, text_page=-1)
+
+    seen = []
+
+    class EnvTesseract(FakeTesseract):
+        def image_to_string(self, src, lang="eng"):
+            seen.append(os.environ.get("OMP_THREAD_LIMIT"))
+            return super().image_to_string(src, lang=lang)
+
+    monkeypatch.setattr(mod, "pytesseract", EnvTesseract())
+    monkeypatch.setattr(mod, "HAVE_TESSEROCR", False)
+    monkeypatch.delenv("UNIFILE_DISABLE_PDF_OCR", raising=False)
+    monkeypatch.delenv("UNIFILE_TESSERACT_OMP", raising=False)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    monkeypatch.setenv("UNIFILE_OCR_BATCH_SIZE", "1")
+
+    monkeypatch.setenv("UNIFILE_OCR_CONCURRENCY", "2")
+    PdfExtractor().extract(p)
+    assert seen == ["1", "1"]
+    assert "OMP_THREAD_LIMIT" not in os.environ
+
+    seen.clear()
+    monkeypatch.setenv("UNIFILE_OCR_CONCURRENCY", "1")
+    PdfExtractor().extract(p)
+    assert seen == [None, None]
+
+    seen.clear()
+    monkeypatch.setenv("UNIFILE_OCR_CONCURRENCY", "2")
+    monkeypatch.setenv("OMP_THREAD_LIMIT", "3")
+    PdfExtractor().extract(p)
+    assert seen == ["3", "3"]
+    assert os.environ["OMP_THREAD_LIMIT"] == "3"
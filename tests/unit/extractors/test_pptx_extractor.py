@@ -26,3 +26,16 @@ def test_pptx_extractor_reads_slide_text(tmp_path):
     r0 = rows[0]
     assert r0.unit_type == "slide"
     assert "Hello slide" in r0.content
+
+
+def test_pptx_extractor_includes_table_cells(tmp_path):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(1), Inches(4), Inches(2)).table
+    for r, c, text in [(0, 0, "a"), (0, 1, "b"), (1, 0, "c"), (1, 1, "d")]:
+        table.cell(r, c).text = text
+    p = tmp_path / "table.pptx"
+    prs.save(p)
+
+    rows = PptxExtractor().extract(p)
+    assert rows[0].content == "a\tb\nc\td"
@@ -14,3 +14,48 @@ def test_text_extractor_reads_text(simple_txt):
     assert r.unit_id == "body"
     assert "hello" in r.content and "world" in r.content
     assert r.char_count == len(r.content)
+
+def test_text_extractor_chunks_large_files(tmp_path, monkeypatch):
+    p = tmp_path / "big.log"
+    lines = [f"line {i:03d}\n" for i in range(50)]
+    p.write_text("".join(lines))
+    monkeypatch.setenv("UNIFILE_TEXT_CHUNK_BYTES", "64")
+
+    rows = TextExtractor().extract(p)
+    assert len(rows) > 1
+    assert all(r.unit_type == "chunk" and r.file_type == "log" for r in rows)
+    assert [r.unit_id for r in rows] == [str(i) for i in range(len(rows))]
+    # Chunks end on line boundaries and reassemble to the original text
+    assert all(r.content.endswith("\n") for r in rows)
+    assert "".join(r.content for r in rows) == "".join(lines)
+    assert rows[1].metadata["offset"] == len(rows[0].content)
+
+def test_text_extractor_detects_encoding_from_leading_window(tmp_path, monkeypatch):
+    import unifile.extractors.txt_extractor as mod
+    # A multi-byte UTF-8 character straddling the probe window is still UTF-8
+    monkeypatch.setattr(mod, "_PROBE_BYTES", 4)
+    p = tmp_path / "utf8.txt"
+    p.write_bytes("abc\u00e9t\u00e9\n".encode("utf-8"))
+    assert TextExtractor().extract(p)[0].content == "abc\u00e9t\u00e9\n"
+
+    monkeypatch.setattr(mod, "_PROBE_BYTES", 64 * 1024)
+    # A legacy multi-byte encoding chardet is confident about
+    p = tmp_path / "sjis.txt"
+    text = "\u3053\u3093\u306b\u3061\u306f\u4e16\u754c\u3001\u30c6\u30b9\u30c8\u3067\u3059\u3002" * 20
+    p.write_bytes(text.encode("shift_jis"))
+    assert TextExtractor().extract(p)[0].content == text
+
+
+def test_text_extractor_stray_bytes_keep_utf8(tmp_path):
+    # A few invalid bytes in UTF-8 text must not send the file to chardet
+    good = "Gr\u00fc\u00dfe \u4f60\u597d Stra\u00dfe " * 200
+    p = tmp_path / "stray.txt"
+    p.write_bytes(good.encode("utf-8") + b"\xff" + "mehr \u00e4\u00f6\u00fc".encode("utf-8"))
+    assert TextExtractor().extract(p)[0].content == good + "\ufffdmehr \u00e4\u00f6\u00fc"
+
+    p.write_bytes(("na\u00efve r\u00e9sum\u00e9 " * 100).encode("utf-8") + b"\xc3\x28")
+    assert TextExtractor().extract(p)[0].content == "na\u00efve r\u00e9sum\u00e9 " * 100 + "\ufffd("
+
+    # Short Latin-1 text: low-confidence guesses fall back to UTF-8 with replacement
+    p.write_bytes("caf\u00e9 au lait".encode("latin-1"))
+    assert TextExtractor().extract(p)[0].content in ("caf\ufffd au lait", "caf\u00e9 au lait")
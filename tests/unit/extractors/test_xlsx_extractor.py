@@ -37,3 +37,48 @@ def test_csv_extractor_reads_table(tmp_path):
     assert rows and rows[0].unit_type == "table"
     assert "x,y" in rows[0].content.splitlines()[0]
     assert rows[0].metadata.get("rows") == 2
+
+def test_excel_extractor_calamine_matches_openpyxl(tmp_path, monkeypatch):
+    pytest.importorskip("python_calamine")
+    import datetime
+    import unifile.extractors.xlsx_extractor as mod
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["a", None, "c"])
+    ws.append([1, 2.5, True])
+    ws.append([datetime.date(2024, 5, 6), datetime.datetime(2024, 1, 2, 3, 4), -0.0])
+    ws.append([1e20, 1.234567890123457e+19, float(2**53 - 1)])
+    wb.create_sheet("Empty")
+    wb.create_sheet("Offset")["C3"] = "x"
+    p = tmp_path / "types.xlsx"
+    wb.save(p)
+
+    ws["A5"].value, ws["A5"].data_type = "#DIV/0!", "e"
+    ws["B5"].value, ws["B5"].data_type = "#N/A", "e"
+    errors = tmp_path / "errors.xlsx"
+    wb.save(errors)
+
+    for path in (p, errors):
+        monkeypatch.setattr(mod, "HAVE_CALAMINE", True)
+        fast = [(r.unit_id, r.content, r.metadata) for r in ExcelExtractor().extract(path)]
+        monkeypatch.setattr(mod, "HAVE_CALAMINE", False)
+        slow = [(r.unit_id, r.content, r.metadata) for r in ExcelExtractor().extract(path)]
+        assert fast == slow
+    assert "#DIV/0!\t#N/A" in fast[0][1]
+
+def test_csv_extractor_keeps_text_and_counts_like_pandas(tmp_path):
+    p = tmp_path / "quoted.csv"
+    p.write_bytes(b'\xef\xbb\xbfa,b\r\n1,"x,\r\ny"\r\n\r\n,\r\n3,4\r\n')
+    r = CsvExtractor().extract(p)[0]
+    assert r.content == 'a,b\n1,"x,\ny"\n\n,\n3,4\n'
+    df = pd.read_csv(p, dtype=str)
+    assert r.metadata == {"rows": len(df), "cols": len(df.columns)}
+
+def test_tsv_extractor_chunked_matches_single_pass(tmp_path):
+    p = tmp_path / "t.tsv"
+    p.write_text("a\tb\n" + "".join(f"{i}\tv,{i}\n" for i in range(7)))
+    r = CsvExtractor(chunksize=3).extract(p)[0]
+    df = pd.read_csv(p, sep="\t", dtype=str)
+    assert r.content == df.to_csv(index=False)
+    assert r.metadata == {"rows": 7, "cols": 2}
@@ -0,0 +1,21 @@
+# Copyright (c) 2025 takotime808
+
+from pathlib import Path
+
+from unifile.extractors.xml_extractor import XmlExtractor, _xml_text_bs4, _xml_text_lxml
+
+def test_xml_extractor_text_and_root(tmp_path: Path):
+    p = tmp_path / "doc.xml"
+    p.write_text('<?xml version="1.0"?><a:root xmlns:a="urn:x"><a:b>Hello</a:b></a:root>')
+    rows = XmlExtractor().extract(p)
+    assert len(rows) == 1
+    assert rows[0].content == "Hello"
+    assert rows[0].metadata["root"] == "root"
+
+def test_xml_iterparse_matches_bs4(tmp_path: Path):
+    p = tmp_path / "doc.xml"
+    p.write_text(
+        '<?xml version="1.0"?>\n<!-- lead -->\n<r>\n  <b>x<![CDATA[y]]>z</b>  \n'
+        " <c/>t<!-- c -->u<?pi data?>v<d>deep<e>er</e>w</d>\n</r>\n"
+    )
+    assert _xml_text_lxml(p) == _xml_text_bs4(p)
@@ -7,6 +7,7 @@ from __future__ import annotations
 import pytest
 # import types
 from pathlib import Path
+import pandas as pd
 
 # Import the pipeline module under test
 import unifile.pipeline as pipeline
@@ -125,3 +126,43 @@ def test_extract_to_table_file_not_found_raises(tmp_path):
     missing = tmp_path / "nope.txt"
     with pytest.raises(FileNotFoundError):
         pipeline.extract_to_table(missing)
+
+
+def test_builtin_factories_reuse_instances_per_thread(monkeypatch, tmp_path):
+    built = []
+
+    class CountingText(DummyExtractor):
+        def __init__(self):
+            super().__init__(file_type="txt", content="C")
+            built.append(self)
+
+    monkeypatch.setattr(pipeline, "TextExtractor", CountingText)
+    monkeypatch.setitem(pipeline._RUNTIME, "reuse_extractors", True)
+    f = tmp_path / "a.txt"
+    f.write_text("x")
+
+    pipeline.extract_to_table(f)
+    pipeline.extract_to_table(f)
+    assert len(built) == 1
+
+    pipeline.extract_to_table(f, reuse_extractors=False)
+    assert len(built) == 2
+
+    # a different thread gets its own instance
+    import threading
+    monkeypatch.setitem(pipeline._RUNTIME, "reuse_extractors", True)
+    t = threading.Thread(target=pipeline.extract_to_table, args=(f,))
+    t.start(); t.join()
+    assert len(built) == 3
+
+
+def test__rows_to_df_row_columns_match_to_dict(tmp_path):
+    p = tmp_path / "a.txt"
+    rows = [
+        make_row(p, "txt", "file", "body", "hi", {"a": 1}),
+        make_row(p, "txt", "file", "x", "", {"o": object()}, status="error", error="boom"),
+    ]
+    df = pipeline._rows_to_df(rows)
+    expected = pd.DataFrame([r.to_dict() for r in rows])[list(df.columns)]
+    pd.testing.assert_frame_equal(df, expected)
+    assert df.loc[1, "metadata"].keys() == {"_repr"}
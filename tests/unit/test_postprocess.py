@@ -0,0 +1,28 @@
+# Copyright (c) 2025 takotime808
+
+import pandas as pd
+
+from unifile.processing.postprocess import chunk_content
+
+
+def _df(text):
+    return pd.DataFrame([{
+        "content": text, "unit_type": "page", "unit_id": "1",
+        "char_count": len(text), "metadata": {"page": 1},
+    }])
+
+
+def test_chunk_content_windows_overlap():
+    out = chunk_content(_df("abcdefghij"), max_chars=4, overlap=1)
+    assert out["content"].tolist() == ["abcd", "defg", "ghij"]
+    assert out["unit_id"].tolist() == ["1:0", "1:1", "1:2"]
+    assert set(out["unit_type"]) == {"page:chunk"}
+    assert out["char_count"].tolist() == [4, 4, 4]
+    assert list(out.columns) == list(_df("").columns)
+
+
+def test_chunk_content_terminates_on_large_overlap():
+    out = chunk_content(_df("abcdef"), max_chars=4, overlap=10)
+    assert out["content"].tolist() == ["abcd", "bcde", "cdef"]
+    assert chunk_content(_df("ab"), max_chars=4, overlap=1)["content"].tolist() == ["ab"]
+    assert chunk_content(_df(""), max_chars=4, overlap=1).empty
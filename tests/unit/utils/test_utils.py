@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from unifile.utils.utils import write_temp_file, json_dumps_safe, norm_ext
+from unifile.utils.utils import write_temp_file, json_dumps_safe, json_loads_safe, norm_ext
 
 
 class LimitedBytesIO(io.BytesIO):
@@ -79,6 +79,15 @@ def test_json_dumps_safe_circular_reference_returns_string():
     assert parsed  # non-empty string
 
 
+def test_json_loads_safe_accepts_what_stdlib_accepts():
+    obj = json_loads_safe(b'{"a": NaN, "b": "caf\xe9", "c": 123456789012345678901234567890}')
+    assert obj["a"] != obj["a"]  # NaN
+    assert obj["b"] == "caf\ufffd"
+    assert obj["c"] == 123456789012345678901234567890
+    with pytest.raises(ValueError):
+        json_loads_safe(b"not json")
+
+
 @pytest.mark.parametrize(
     "value,expected",
     [